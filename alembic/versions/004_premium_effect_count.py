@@ -0,0 +1,39 @@
+"""premium effect count on series
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-08-29
+
+Materializes the enabled-premium-effect count so credit estimation reads a
+scalar instead of scanning the visualEffects JSON per call. Backfills from
+existing rows using jsonb_array_elements.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "series",
+        sa.Column("premiumEffectCount", sa.Integer(), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE series SET "premiumEffectCount" = (
+            SELECT count(*) FROM jsonb_array_elements("visualEffects") e
+            WHERE e->>'enabled' = 'true' AND e->>'isPremium' = 'true'
+        )
+        WHERE "visualEffects" IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("series", "premiumEffectCount")
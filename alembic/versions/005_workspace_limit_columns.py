@@ -0,0 +1,54 @@
+"""generated scalar columns for workspace limits
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-08-29
+
+Projects the hot limits keys into stored generated integer columns so flag
+reads don't decode the whole JSONB blob.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workspaces",
+        sa.Column(
+            "maxSeries",
+            sa.Integer(),
+            sa.Computed("((limits->>'maxSeries')::int)", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "workspaces",
+        sa.Column(
+            "maxConnectedAccounts",
+            sa.Integer(),
+            sa.Computed("((limits->>'maxConnectedAccounts')::int)", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "workspaces",
+        sa.Column(
+            "maxPremiumEffectsPerVideo",
+            sa.Integer(),
+            sa.Computed("((limits->>'maxPremiumEffectsPerVideo')::int)", persisted=True),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("workspaces", "maxPremiumEffectsPerVideo")
+    op.drop_column("workspaces", "maxConnectedAccounts")
+    op.drop_column("workspaces", "maxSeries")
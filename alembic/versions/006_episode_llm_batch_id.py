@@ -0,0 +1,28 @@
+"""llm batch id on episodes
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-08-29
+
+Tracks the OpenAI Batch API job an episode's script was submitted under.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "episodes",
+        sa.Column("llmBatchId", sa.String(64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("episodes", "llmBatchId")
@@ -0,0 +1,40 @@
+"""unique index on social_accounts (workspaceId, platform)
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-08-29
+
+The OAuth callback looks up accounts by (workspace, platform) on every
+connect; a composite unique index makes that a single btree probe and
+enforces the one-account-per-platform assumption the code already makes.
+Built CONCURRENTLY so it doesn't block writes on large tables.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_social_accounts_workspace_platform",
+            "social_accounts",
+            ["workspaceId", "platform"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_social_accounts_workspace_platform",
+            table_name="social_accounts",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,39 @@
+"""index on episodes (seriesId, scheduledAt)
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-08-29
+
+Scheduling dedups new slots against a series' existing episodes and the
+beat publisher scans by scheduled_at; a composite index turns both from
+full-table scans into range probes. Built CONCURRENTLY so it doesn't
+block writes on large tables.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_episodes_series_scheduled",
+            "episodes",
+            ["seriesId", "scheduledAt"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_episodes_series_scheduled",
+            table_name="episodes",
+            postgresql_concurrently=True,
+        )
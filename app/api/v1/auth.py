@@ -81,10 +81,9 @@ def login(
 @router.post("/refresh", response_model=RefreshResponse)
 def refresh(
     body: RefreshRequest,
-    db: DbSession,
 ):
     try:
-        _, access, refresh = refresh_tokens(db, body.refreshToken)
+        access, refresh = refresh_tokens(body.refreshToken)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
     return RefreshResponse(accessToken=access, refreshToken=refresh)
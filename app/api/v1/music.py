@@ -92,7 +92,7 @@ def upload(
     ext = EXT_BY_CONTENT.get(content_type, ".mp3")
     key = music_upload_key(workspace.id, asset_id, ext)
 
-    if settings.aws_access_key_id and settings.aws_secret_access_key:
+    if settings.s3_configured:
         url = upload_file(key, file.file, content_type)
     else:
         url = f"https://storage.example.com/music/{workspace.id}/{asset_id}"
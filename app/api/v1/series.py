@@ -1,11 +1,16 @@
 """Series wizard and launch endpoints."""
 
+from functools import lru_cache
 from uuid import UUID
 from sqlalchemy import func
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 
 from app.dependencies import CurrentUser, CurrentWorkspace, DbSession
 from app.schemas.series import (
+    SERIES_ADAPTER,
+    SERIES_LIST_ADAPTER,
     SeriesCreateBody,
     SeriesResponse,
     Step1ContentTypeUpdate,
@@ -32,6 +37,7 @@ from app.services.series_service import (
     update_step_7,
     update_step_8,
     update_step_9,
+    update_series_bulk,
     launch_series as do_launch_series,
 )
 from app.services.credits_service import estimate_credits_per_episode
@@ -40,8 +46,8 @@ from app.db.models.episode import Episode
 router = APIRouter(prefix="/series", tags=["series"])
 
 
-def _series_response(series):
-    return SeriesResponse(
+def _series_dict(series) -> dict:
+    return dict(
         id=series.id,
         workspaceId=series.workspace_id,
         name=series.name,
@@ -63,6 +69,62 @@ def _series_response(series):
     )
 
 
+def _series_response(series) -> SeriesResponse:
+    return SERIES_ADAPTER.validate_python(_series_dict(series))
+
+
+# Wizard step schemas parsed through the payload cache below. The FE autosaves
+# each step on a debounce, so identical bodies arrive repeatedly; caching the
+# parsed model by (schema, raw bytes) skips revalidation for those repeats.
+_STEP_SCHEMAS: dict[str, type[BaseModel]] = {
+    cls.__qualname__: cls
+    for cls in (
+        Step1ContentTypeUpdate,
+        Step2ScriptPreferencesUpdate,
+        Step3VoiceLanguageUpdate,
+        Step4MusicUpdate,
+        Step5ArtStyleUpdate,
+        Step6CaptionStyleUpdate,
+        Step9ScheduleUpdate,
+    )
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_step(cls_qualname: str, body_bytes: bytes) -> BaseModel:
+    return _STEP_SCHEMAS[cls_qualname].model_validate_json(body_bytes)
+
+
+def _cached_step_body(cls: type[BaseModel]):
+    """Dependency that validates the raw request body through _parse_step."""
+
+    async def dep(request: Request) -> BaseModel:
+        body = await request.body()
+        try:
+            return _parse_step(cls.__qualname__, body)
+        except ValidationError as e:
+            # Match FastAPI's own body validation: loc starts with "body".
+            raise RequestValidationError(
+                [{**err, "loc": ("body", *err.get("loc", ()))} for err in e.errors()]
+            )
+
+    return dep
+
+
+def _step_body_openapi(cls: type[BaseModel]) -> dict:
+    """requestBody declaration for routes whose body is read via _cached_step_body.
+
+    Reading the body through a Request dependency hides the schema from
+    FastAPI's introspection, so it is declared explicitly per route.
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": cls.model_json_schema()}},
+        }
+    }
+
+
 def _require_series(db: DbSession, series_id: UUID, workspace_id: UUID):
     s = get_series(db, series_id, workspace_id)
     if not s:
@@ -78,7 +140,7 @@ def series_list(
 ):
     """List all series in the current workspace."""
     series_list_result = list_series(db, workspace.id)
-    return [_series_response(s) for s in series_list_result]
+    return SERIES_LIST_ADAPTER.validate_python([_series_dict(s) for s in series_list_result])
 
 
 @router.post("", response_model=SeriesResponse)
@@ -109,13 +171,13 @@ def series_get(
     return _series_response(series)
 
 
-@router.patch("/{id}/step/1-content-type", response_model=SeriesResponse)
+@router.patch("/{id}/step/1-content-type", response_model=SeriesResponse, openapi_extra=_step_body_openapi(Step1ContentTypeUpdate))
 def step_1(
     id: UUID,
-    body: Step1ContentTypeUpdate,
     db: DbSession,
     user: CurrentUser,
     workspace: CurrentWorkspace,
+    body: Step1ContentTypeUpdate = Depends(_cached_step_body(Step1ContentTypeUpdate)),
 ):
     series = _require_series(db, id, workspace.id)
     update_step_1(
@@ -128,52 +190,52 @@ def step_1(
     return _series_response(series)
 
 
-@router.patch("/{id}/step/2-script-preferences", response_model=SeriesResponse)
+@router.patch("/{id}/step/2-script-preferences", response_model=SeriesResponse, openapi_extra=_step_body_openapi(Step2ScriptPreferencesUpdate))
 def step_2(
     id: UUID,
-    body: Step2ScriptPreferencesUpdate,
     db: DbSession,
     user: CurrentUser,
     workspace: CurrentWorkspace,
+    body: Step2ScriptPreferencesUpdate = Depends(_cached_step_body(Step2ScriptPreferencesUpdate)),
 ):
     series = _require_series(db, id, workspace.id)
     update_step_2(db, series, body.model_dump(exclude_none=True))
     return _series_response(series)
 
 
-@router.patch("/{id}/step/3-voice-language", response_model=SeriesResponse)
+@router.patch("/{id}/step/3-voice-language", response_model=SeriesResponse, openapi_extra=_step_body_openapi(Step3VoiceLanguageUpdate))
 def step_3(
     id: UUID,
-    body: Step3VoiceLanguageUpdate,
     db: DbSession,
     user: CurrentUser,
     workspace: CurrentWorkspace,
+    body: Step3VoiceLanguageUpdate = Depends(_cached_step_body(Step3VoiceLanguageUpdate)),
 ):
     series = _require_series(db, id, workspace.id)
     update_step_3(db, series, body.model_dump(exclude_none=True))
     return _series_response(series)
 
 
-@router.patch("/{id}/step/4-music", response_model=SeriesResponse)
+@router.patch("/{id}/step/4-music", response_model=SeriesResponse, openapi_extra=_step_body_openapi(Step4MusicUpdate))
 def step_4(
     id: UUID,
-    body: Step4MusicUpdate,
     db: DbSession,
     user: CurrentUser,
     workspace: CurrentWorkspace,
+    body: Step4MusicUpdate = Depends(_cached_step_body(Step4MusicUpdate)),
 ):
     series = _require_series(db, id, workspace.id)
     update_step_4(db, series, body.model_dump(exclude_none=True))
     return _series_response(series)
 
 
-@router.patch("/{id}/step/5-art-style", response_model=SeriesResponse)
+@router.patch("/{id}/step/5-art-style", response_model=SeriesResponse, openapi_extra=_step_body_openapi(Step5ArtStyleUpdate))
 def step_5(
     id: UUID,
-    body: Step5ArtStyleUpdate,
     db: DbSession,
     user: CurrentUser,
     workspace: CurrentWorkspace,
+    body: Step5ArtStyleUpdate = Depends(_cached_step_body(Step5ArtStyleUpdate)),
 ):
     series = _require_series(db, id, workspace.id)
     # Use by_alias=True so payload has artStyle, artIntensity (FE names) for storage
@@ -184,60 +246,66 @@ def step_5(
     return _series_response(series)
 
 
-@router.patch("/{id}/step/6-caption-style", response_model=SeriesResponse)
+@router.patch("/{id}/step/6-caption-style", response_model=SeriesResponse, openapi_extra=_step_body_openapi(Step6CaptionStyleUpdate))
 def step_6(
     id: UUID,
-    body: Step6CaptionStyleUpdate,
     db: DbSession,
     user: CurrentUser,
     workspace: CurrentWorkspace,
+    body: Step6CaptionStyleUpdate = Depends(_cached_step_body(Step6CaptionStyleUpdate)),
 ):
     series = _require_series(db, id, workspace.id)
     update_step_6(db, series, body.model_dump(exclude_none=True))
     return _series_response(series)
 
 
+def _parse_effects(payload: dict) -> list[dict] | None:
+    """Normalize the FE's effect payload variants to the canonical array shape.
+
+    Accepts:
+    - Array format: { "effects": [{ "type": "animatedHook", "enabled": false, ... }] }
+    - Object format (FE): { "effects": { "animatedHook": { enabled, isPremium }, ... } }
+    - Or top-level keys: { "animatedHook": { enabled }, ... }
+    """
+    raw = payload.get("effects")
+    if isinstance(raw, list):
+        # Pass the list through untouched: Step7EffectsUpdate rejects
+        # malformed entries with a 422 rather than silently dropping them.
+        return raw or None
+    obj = raw if isinstance(raw, dict) else payload
+    out = []
+    for effect_name, effect_data in obj.items():
+        if not isinstance(effect_data, dict):
+            continue
+        out.append({
+            "type": effect_name,
+            "enabled": effect_data.get("enabled", True),
+            "isPremium": effect_data.get("isPremium", False),
+            "params": effect_data.get("params"),
+        })
+    return out if out else None
+
+
 @router.patch("/{id}/step/7-effects", response_model=SeriesResponse)
 @router.patch("/{id}/step/7-visual-effects", response_model=SeriesResponse)  # Alias for FE compatibility
 def step_7(
     id: UUID,
-    body: Step7EffectsUpdate,
+    payload: dict,
     db: DbSession,
     user: CurrentUser,
     workspace: CurrentWorkspace,
 ):
     """Step 7: Visual effects. Accepts both /step/7-effects and /step/7-visual-effects.
-    
-    Accepts either:
-    - Array format: { "effects": [{ "type": "animatedHook", "enabled": false, ... }] }
-    - Object format (FE): { "effects": { "animatedHook": { enabled, isPremium }, "filmGrain": { enabled }, ... } }
-    - Or top-level keys: { "animatedHook": { enabled }, ... }
+
+    Payload variants are normalized by _parse_effects, then validated once
+    against the canonical list[EffectItemSchema] shape.
     """
     series = _require_series(db, id, workspace.id)
-
-    def object_to_effects_array(obj):
-        out = []
-        for effect_name, effect_data in (obj or {}).items():
-            if not isinstance(effect_data, dict):
-                continue
-            out.append({
-                "type": effect_name,
-                "enabled": effect_data.get("enabled", True),
-                "isPremium": effect_data.get("isPremium", False),
-                "params": effect_data.get("params"),
-            })
-        return out if out else None
-
-    if body.effects is None:
-        # Top-level effect keys (extra fields)
-        body_dict = body.model_dump(exclude_none=True, exclude={"effects"})
-        effects = object_to_effects_array(body_dict)
-    elif isinstance(body.effects, list):
-        effects = [e.model_dump() for e in body.effects]
-    else:
-        # effects is a dict (FE format: { effects: { animatedHook: {...}, filmGrain: {...} } })
-        effects = object_to_effects_array(body.effects)
-
+    try:
+        body = Step7EffectsUpdate(effects=_parse_effects(payload))
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+    effects = [e.model_dump() for e in body.effects] if body.effects is not None else None
     update_step_7(db, series, effects)
     return _series_response(series)
 
@@ -258,19 +326,90 @@ def step_8(
     return _series_response(series)
 
 
-@router.patch("/{id}/step/9-schedule", response_model=SeriesResponse)
+@router.patch("/{id}/step/9-schedule", response_model=SeriesResponse, openapi_extra=_step_body_openapi(Step9ScheduleUpdate))
 def step_9(
     id: UUID,
-    body: Step9ScheduleUpdate,
     db: DbSession,
     user: CurrentUser,
     workspace: CurrentWorkspace,
+    body: Step9ScheduleUpdate = Depends(_cached_step_body(Step9ScheduleUpdate)),
 ):
     series = _require_series(db, id, workspace.id)
     update_step_9(db, series, body.model_dump(exclude_none=True))
     return _series_response(series)
 
 
+# Validated schema per step for the composite PATCH below; steps 7 and 8 have
+# bespoke payload handling and are normalized inline in steps_bulk.
+_BULK_STEP_SCHEMAS: dict[int, type[BaseModel]] = {
+    1: Step1ContentTypeUpdate,
+    2: Step2ScriptPreferencesUpdate,
+    3: Step3VoiceLanguageUpdate,
+    4: Step4MusicUpdate,
+    5: Step5ArtStyleUpdate,
+    6: Step6CaptionStyleUpdate,
+    9: Step9ScheduleUpdate,
+}
+
+
+def _bulk_step_payload(step: int, raw: dict) -> dict:
+    """Validate one step's payload and shape it for update_series_bulk."""
+    if step == 7:
+        body = Step7EffectsUpdate(effects=_parse_effects(raw))
+        return {"effects": [e.model_dump() for e in body.effects] if body.effects is not None else None}
+    if step == 8:
+        body = Step8SocialUpdate.model_validate(raw)
+        ids = body.socialAccountIds if body.socialAccountIds is not None else body.connectedAccountIds
+        return {"socialAccountIds": ids}
+    model = _BULK_STEP_SCHEMAS[step].model_validate(raw)
+    if step == 1:
+        return {
+            "name": model.name,
+            "contentType": model.contentType,
+            "customTopic": model.customTopic.model_dump() if model.customTopic else None,
+        }
+    if step == 5:
+        payload = model.model_dump(exclude_none=True, by_alias=True)
+        if model.colorTheme:
+            payload["colorTheme"] = model.colorTheme.model_dump(exclude_none=True)
+        return payload
+    return model.model_dump(exclude_none=True)
+
+
+@router.patch("/{id}/steps", response_model=SeriesResponse)
+def steps_bulk(
+    id: UUID,
+    payload: dict,
+    db: DbSession,
+    user: CurrentUser,
+    workspace: CurrentWorkspace,
+):
+    """Apply several wizard steps in one transaction.
+
+    Body maps step numbers to the same payloads the per-step routes accept,
+    e.g. { "2": {...}, "5": {...} }. All steps are validated up front, applied
+    together, and committed once (single estimate recompute + refresh).
+    """
+    series = _require_series(db, id, workspace.id)
+    updates: dict[int, dict] = {}
+    for key, raw in payload.items():
+        try:
+            step = int(key)
+        except (TypeError, ValueError):
+            step = 0
+        if step not in range(1, 10) or not isinstance(raw, dict):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid wizard step: {key!r}",
+            )
+        try:
+            updates[step] = _bulk_step_payload(step, raw)
+        except ValidationError as e:
+            raise RequestValidationError(e.errors())
+    update_series_bulk(db, series, updates)
+    return _series_response(series)
+
+
 @router.post("/{id}/estimate-credits")
 def estimate_credits(
     id: UUID,
@@ -8,6 +8,7 @@ from fastapi import APIRouter, HTTPException, Request, status
 from fastapi.responses import RedirectResponse
 
 from app.config import get_settings
+from app.core.oauth_state import invalidate_social_account_id
 from app.dependencies import ConnectUserWorkspace, CurrentUser, CurrentWorkspace, DbSession
 from app.db.models.social_account import SocialAccount
 from app.schemas.social import (
@@ -260,6 +261,8 @@ def disconnect_account(
     )
     if not acc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
+    platform = acc.platform
     db.delete(acc)
     db.commit()
+    invalidate_social_account_id(str(workspace.id), platform)
     return {"ok": True}
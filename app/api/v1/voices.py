@@ -1,5 +1,6 @@
 """Voice and TTS preview endpoints."""
 
+import tempfile
 from typing import Optional
 from fastapi import APIRouter, Query, HTTPException, status
 
@@ -10,7 +11,7 @@ from app.schemas.voice_music import (
     VoicePreviewResponse,
 )
 from app.services.tts_service import list_voices as tts_list_voices, synthesize as tts_synthesize
-from app.services.storage_service import upload_bytes, voice_preview_key, presigned_url
+from app.services.storage_service import upload_file, voice_preview_key, presigned_url
 from app.config import get_settings
 
 router = APIRouter(prefix="/voices", tags=["voices"])
@@ -75,16 +76,21 @@ def preview(
         )
     voice_id = (body.providerVoiceId or (str(body.voiceId) if body.voiceId else None)) or "alloy"
     sample = (body.text or "Hello, this is a short preview of this voice.").strip()[:500]
+    key = voice_preview_key(workspace.id, voice_id)
     try:
-        audio_bytes = tts_synthesize(sample, voice_id=voice_id)
+        if settings.s3_configured:
+            # Stream TTS audio into a spooled buffer and hand that file
+            # object to S3: one copy at most, disk-backed past 8 MB,
+            # instead of full bytes plus a BytesIO duplicate.
+            with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as buf:
+                tts_synthesize(sample, voice_id=voice_id, dest=buf)
+                buf.seek(0)
+                upload_file(key, buf, "audio/mpeg")
+            preview_url = presigned_url(key, expiration=3600)
+        else:
+            tts_synthesize(sample, voice_id=voice_id)
+            preview_url = "https://example.com/preview.mp3"
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    key = voice_preview_key(workspace.id, voice_id)
-    if settings.aws_access_key_id and settings.aws_secret_access_key:
-        upload_bytes(key, audio_bytes, "audio/mpeg")
-        preview_url = presigned_url(key, expiration=3600)
-    else:
-        preview_url = "https://example.com/preview.mp3"
-
     return VoicePreviewResponse(previewUrl=preview_url)
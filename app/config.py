@@ -59,6 +59,24 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     openai_model: str = "gpt-4o-mini"
     openai_base_url: Optional[str] = None
+    use_openai_batch_api: bool = Field(
+        default=False,
+        validation_alias="USE_OPENAI_BATCH_API",
+        description=(
+            "Submit scheduled (non-interactive) script generation through OpenAI's Batch API "
+            "(50% token price, 24h SLA). Only used when episodes are scheduled far enough out."
+        ),
+    )
+    llm_scene_cache_ttl_seconds: int = Field(
+        default=604800,  # 7 days
+        validation_alias="LLM_SCENE_CACHE_TTL_SECONDS",
+        description="TTL for cached scene-generation responses in Redis; 0 disables the cache.",
+    )
+    openai_concurrency: int = Field(
+        default=8,
+        validation_alias="OPENAI_CONCURRENCY",
+        description="Max concurrent OpenAI requests for bulk script/scene generation.",
+    )
 
     # Frontend
     cors_origins: List[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
@@ -177,6 +195,11 @@ class Settings(BaseSettings):
     def celery_broker(self) -> str:
         return self.celery_broker_url or self.redis_url
 
+    @property
+    def s3_configured(self) -> bool:
+        """True when AWS credentials are set (uploads and presigning enabled)."""
+        return bool(self.aws_access_key_id and self.aws_secret_access_key)
+
 
 @lru_cache
 def get_settings() -> Settings:
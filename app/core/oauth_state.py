@@ -5,15 +5,21 @@ from typing import Any, Optional
 
 import redis
 
-from app.config import get_settings
+from app.core.redis_client import get_redis_text
 
 STATE_TTL_SECONDS = 600  # 10 minutes
 STATE_PREFIX = "oauth_state:"
 
+# Short-TTL cache of workspace+platform -> SocialAccount id so reconnect
+# callbacks resolve the existing row with a primary-key get instead of a
+# filtered query. Only skips a lookup, never authorization, so a small
+# grace window after disconnect is acceptable.
+ACCOUNT_TTL_SECONDS = 300
+ACCOUNT_PREFIX = "social:"
+
 
 def _client() -> redis.Redis:
-    settings = get_settings()
-    return redis.from_url(settings.redis_url, decode_responses=True)
+    return get_redis_text()
 
 
 def set_oauth_state(
@@ -32,13 +38,45 @@ def set_oauth_state(
     client.setex(key, STATE_TTL_SECONDS, value)
 
 
-def get_oauth_state(state: str) -> Optional[dict[str, Any]]:
-    """Retrieve and delete state; return {workspace_id, platform} or None."""
+def pop_oauth_state(state: str) -> Optional[dict[str, Any]]:
+    """Atomically retrieve and consume state; return {workspace_id, platform} or None.
+
+    GETDEL fetches and deletes in one round-trip, so a state can never be
+    replayed between the read and the delete. Falls back to a pipelined
+    GET+DEL on Redis older than 6.2.
+    """
     client = _client()
     key = f"{STATE_PREFIX}{state}"
-    value = client.get(key)
+    try:
+        value = client.getdel(key)
+    except redis.ResponseError:
+        pipe = client.pipeline()
+        pipe.get(key)
+        pipe.delete(key)
+        value, _ = pipe.execute()
     if value is None:
         return None
-    client.delete(key)
-    data = json.loads(value)
-    return data
+    return json.loads(value)
+
+
+def cache_social_account_id(workspace_id: str, platform: str, account_id: str) -> None:
+    """Remember which SocialAccount backs (workspace, platform). Best-effort."""
+    try:
+        _client().setex(f"{ACCOUNT_PREFIX}{workspace_id}:{platform}", ACCOUNT_TTL_SECONDS, account_id)
+    except Exception:
+        pass
+
+
+def get_cached_social_account_id(workspace_id: str, platform: str) -> Optional[str]:
+    try:
+        return _client().get(f"{ACCOUNT_PREFIX}{workspace_id}:{platform}")
+    except Exception:
+        return None
+
+
+def invalidate_social_account_id(workspace_id: str, platform: str) -> None:
+    """Drop the cached account id (call on disconnect)."""
+    try:
+        _client().delete(f"{ACCOUNT_PREFIX}{workspace_id}:{platform}")
+    except Exception:
+        pass
@@ -0,0 +1,26 @@
+"""Process-wide Redis clients, one per decode mode.
+
+redis.from_url builds a fresh connection pool every call; the best-effort
+caches (TTS audio, LLM responses, media locks, OAuth state) were paying a
+TCP connect per GET/SETEX. These cached clients hand every caller the same
+pool. redis-py pools are thread-safe and reset themselves after a fork, so
+one client per prefork worker child is safe.
+"""
+
+from functools import lru_cache
+
+import redis
+
+from app.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    """Shared binary client (audio bytes and other raw payloads)."""
+    return redis.from_url(get_settings().redis_url)
+
+
+@lru_cache(maxsize=1)
+def get_redis_text() -> redis.Redis:
+    """Shared client with decode_responses=True for string payloads."""
+    return redis.from_url(get_settings().redis_url, decode_responses=True)
@@ -2,7 +2,7 @@
 
 import base64
 import hashlib
-from typing import Optional
+from functools import lru_cache
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
@@ -10,13 +10,11 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from app.config import get_settings
 
-_FERNET: Optional[Fernet] = None
-
 
+@lru_cache(maxsize=1)
 def _get_fernet() -> Fernet:
-    global _FERNET
-    if _FERNET is not None:
-        return _FERNET
+    # The 100k-iteration PBKDF2 runs exactly once per process; every
+    # encrypt/decrypt after that is a cheap AES call on the cached Fernet.
     settings = get_settings()
     key_material = hashlib.sha256(settings.secret_key.encode()).digest()
     # Fernet needs 32 url-safe base64-encoded bytes
@@ -27,8 +25,12 @@ def _get_fernet() -> Fernet:
         iterations=100000,
     ).derive(key_material)
     key = base64.urlsafe_b64encode(derived)
-    _FERNET = Fernet(key)
-    return _FERNET
+    return Fernet(key)
+
+
+def warm_token_encryption() -> None:
+    """Derive the Fernet key ahead of time so no request pays the PBKDF2 cost."""
+    _get_fernet()
 
 
 def encrypt_token(plain: str) -> str:
@@ -66,6 +66,12 @@ class Episode(Base):
         String(20),
         nullable=True,
     )  # PENDING, PROCESSING, DONE, FAILED
+    # OpenAI Batch API job id when the script was submitted via batch (see llm_batch.py).
+    llm_batch_id: Mapped[Optional[str]] = mapped_column(
+        "llmBatchId",
+        String(64),
+        nullable=True,
+    )
     error: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
     credits_used: Mapped[float] = mapped_column("creditsUsed", Float, default=0)
     created_at: Mapped[datetime] = mapped_column(
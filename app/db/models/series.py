@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -85,6 +85,13 @@ class Series(Base):
         JSONB,
         nullable=True,
     )  # array of { type, enabled, isPremium, params }
+    # Materialized count of enabled premium effects, kept in sync whenever
+    # visual_effects is written so credit estimates skip the Python scan.
+    premium_effect_count: Mapped[Optional[int]] = mapped_column(
+        "premiumEffectCount",
+        Integer,
+        nullable=True,
+    )
 
     # Schedule (JSON)
     schedule: Mapped[Optional[Dict[str, Any]]] = mapped_column(
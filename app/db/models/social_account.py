@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -19,6 +19,11 @@ if TYPE_CHECKING:
 
 class SocialAccount(Base):
     __tablename__ = "social_accounts"
+    # The OAuth callback and publish paths always look up by (workspace,
+    # platform); unique because the code assumes at most one account per pair.
+    __table_args__ = (
+        Index("ix_social_accounts_workspace_platform", "workspaceId", "platform", unique=True),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
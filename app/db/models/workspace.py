@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import Computed, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -36,6 +36,26 @@ class Workspace(Base):
     plan: Mapped[str] = mapped_column(String(50), default="free", nullable=False)
     credits_balance: Mapped[int] = mapped_column("creditsBalance", default=0, nullable=False)
     limits: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+    # Generated scalar projections of hot limits keys, so flag reads are a
+    # fixed-width column access instead of decoding the whole JSONB blob.
+    max_series: Mapped[Optional[int]] = mapped_column(
+        "maxSeries",
+        Integer,
+        Computed("((limits->>'maxSeries')::int)", persisted=True),
+        nullable=True,
+    )
+    max_connected_accounts: Mapped[Optional[int]] = mapped_column(
+        "maxConnectedAccounts",
+        Integer,
+        Computed("((limits->>'maxConnectedAccounts')::int)", persisted=True),
+        nullable=True,
+    )
+    max_premium_effects_per_video: Mapped[Optional[int]] = mapped_column(
+        "maxPremiumEffectsPerVideo",
+        Integer,
+        Computed("((limits->>'maxPremiumEffectsPerVideo')::int)", persisted=True),
+        nullable=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         "createdAt",
         DateTime(timezone=True),
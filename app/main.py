@@ -10,6 +10,7 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.config import get_settings
+from app.core.token_encryption import warm_token_encryption
 from app.api.v1.router import api_router
 from app.api.v1.billing import router as billing_router
 
@@ -24,6 +25,9 @@ async def lifespan(app: FastAPI):
     """Startup/shutdown lifecycle."""
     settings = get_settings()
     logger.info("Starting %s (env=%s)", settings.app_name, settings.environment)
+    # Pay the one-time PBKDF2 key derivation at boot, not on the first
+    # OAuth callback that touches a token.
+    warm_token_encryption()
     yield
     logger.info("Shutting down %s", settings.app_name)
 
@@ -1,8 +1,8 @@
 """Series and wizard step schemas."""
 
-from typing import Any, Optional, Union
+from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 
 # ---- Step 1: Content type ----
@@ -105,15 +105,14 @@ class EffectItemSchema(BaseModel):
 
 
 class Step7EffectsUpdate(BaseModel):
-    """Accepts either array or object for effects (FE sends effects as object keyed by name).
-    
-    Frontend format: { "effects": { "animatedHook": { enabled, isPremium }, "filmGrain": { enabled }, ... } }
-    Or top-level: { "animatedHook": { enabled }, "filmGrain": { enabled }, ... }
-    Backend array format: { "effects": [{ type: "animatedHook", enabled, isPremium }, ...] }
-    """
-    effects: Optional[Union[list[EffectItemSchema], dict[str, Any]]] = None
+    """Canonical step-7 payload: a list of effect items.
 
-    model_config = {"extra": "allow"}
+    The FE's object formats (effects keyed by name, or top-level effect keys)
+    are normalized in the router before validation, so this schema stays a
+    single shape and pydantic-core keeps its fast list path — no Union
+    dispatch, no extra-field copying.
+    """
+    effects: Optional[list[EffectItemSchema]] = None
 
 
 # ---- Step 8: Social ----
@@ -165,3 +164,12 @@ class LaunchSeriesResponse(BaseModel):
     series: SeriesResponse
     upcomingEpisodes: list[dict]
     creditEstimate: dict
+
+
+# Build the response validators at import time so the first hot request doesn't
+# pay pydantic-core's lazy schema compilation; the list adapter also validates
+# whole result sets in one pydantic-core call instead of a Python loop.
+SeriesResponse.model_rebuild(force=True)
+LaunchSeriesResponse.model_rebuild(force=True)
+SERIES_ADAPTER: TypeAdapter[SeriesResponse] = TypeAdapter(SeriesResponse)
+SERIES_LIST_ADAPTER: TypeAdapter[list[SeriesResponse]] = TypeAdapter(list[SeriesResponse])
@@ -10,8 +10,7 @@ import httpx
 
 from app.config import get_settings
 from app.core.security import (
-    create_access_token,
-    create_refresh_token,
+    create_token_pair,
     decode_token,
     hash_password,
     verify_password,
@@ -57,8 +56,7 @@ def register(
     db.commit()
     db.refresh(user)
     db.refresh(workspace)
-    access = create_access_token(str(user.id))
-    refresh = create_refresh_token(str(user.id))
+    access, refresh = create_token_pair(str(user.id))
     return user, workspace, access, refresh
 
 
@@ -74,25 +72,24 @@ def login(db: Session, email: str, password: str) -> tuple[User, Workspace, str,
     workspace = db.query(Workspace).filter(Workspace.id == member.workspace_id).first()
     if not workspace:
         raise ValueError("Workspace not found")
-    access = create_access_token(str(user.id))
-    refresh = create_refresh_token(str(user.id))
+    access, refresh = create_token_pair(str(user.id))
     return user, workspace, access, refresh
 
 
-def refresh_tokens(db: Session, refresh_token: str) -> tuple[User, str, str]:
-    """Validate refresh token and return (user, new_access_token, new_refresh_token)."""
+def refresh_tokens(refresh_token: str) -> tuple[str, str]:
+    """Validate refresh token and return (new_access_token, new_refresh_token).
+
+    The signed token already proves the user's identity, so no DB lookup is
+    needed here — tokens are minted straight from the verified `sub` claim.
+    """
     payload = decode_token(refresh_token)
     if not payload or payload.get("type") != "refresh":
         raise ValueError("Invalid refresh token")
     user_id = payload.get("sub")
     if not user_id:
         raise ValueError("Invalid refresh token")
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise ValueError("User not found")
-    access = create_access_token(str(user.id))
-    refresh = create_refresh_token(str(user.id))
-    return user, access, refresh
+    access, refresh = create_token_pair(user_id)
+    return access, refresh
 
 
 def request_password_reset(db: Session, email: str) -> None:
@@ -217,6 +214,5 @@ def login_or_register_with_google(
         db.refresh(user)
         db.refresh(workspace)
 
-    access = create_access_token(str(user.id))
-    refresh = create_refresh_token(str(user.id))
+    access, refresh = create_token_pair(str(user.id))
     return user, workspace, access, refresh
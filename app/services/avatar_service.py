@@ -171,7 +171,7 @@ def ensure_series_avatar_image_url(db: Session, series: Series) -> str:
     settings = get_settings()
     workspace_id = series.workspace_id
     key = f"workspaces/{workspace_id}/series/{series.id}/avatar.png"
-    if settings.aws_access_key_id and settings.aws_secret_access_key:
+    if settings.s3_configured:
         url = upload_bytes(key, img_bytes, "image/png")
     else:
         url = f"https://storage.example.com/{key}"
@@ -11,13 +11,18 @@ metadata) after generating so future episodes can reuse.
 
 from app.services.cache.character_cache import get_character_asset_id, set_character_asset_id
 from app.services.cache.image_cache import get_cached_image_asset_id, set_cached_image_asset_id
-from app.services.cache.tts_cache import get_cached_tts_asset_id, set_cached_tts_asset_id
+from app.services.cache.tts_cache import (
+    get_cached_tts_asset_id,
+    set_cached_tts_asset_id,
+    tts_cache_metadata,
+)
 
 __all__ = [
     "get_cached_image_asset_id",
     "set_cached_image_asset_id",
     "get_cached_tts_asset_id",
     "set_cached_tts_asset_id",
+    "tts_cache_metadata",
     "get_character_asset_id",
     "set_character_asset_id",
 ]
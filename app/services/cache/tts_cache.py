@@ -48,6 +48,15 @@ def get_cached_tts_asset_id(
     return row[0] if row else None
 
 
+def tts_cache_metadata(text: str, voice_id: str) -> dict[str, str]:
+    """Metadata entries that make an audio asset discoverable by the TTS cache.
+
+    Merge into metadata_ at insert time (e.g. bulk inserts) instead of
+    updating the row afterwards with set_cached_tts_asset_id.
+    """
+    return {"text_hash": _text_hash(text, voice_id), "voice_id": voice_id}
+
+
 def set_cached_tts_asset_id(
     db: Session,
     workspace_id: uuid.UUID,
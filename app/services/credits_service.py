@@ -4,6 +4,11 @@ from app.db.models.series import Series
 from app.db.models.workspace import Workspace
 
 
+def count_premium_effects(effects: list) -> int:
+    """Count enabled premium effects in a visualEffects JSON list."""
+    return sum(1 for e in effects if e.get("enabled") and e.get("isPremium"))
+
+
 def estimate_credits_per_episode(series: Series) -> float:
     """
     Compute per-episode credit consumption from series config.
@@ -16,8 +21,10 @@ def estimate_credits_per_episode(series: Series) -> float:
         base += 8.0
     elif style in ("realistic", "cartoon", "comic"):
         base += 4.0
-    effects = series.visual_effects or []
-    premium_count = sum(1 for e in effects if e.get("enabled") and e.get("isPremium"))
+    premium_count = series.premium_effect_count
+    if premium_count is None:  # legacy rows predating the materialized count
+        effects = series.visual_effects or []
+        premium_count = count_premium_effects(effects)
     base += premium_count * 5.0
     return round(base, 1)
 
@@ -26,11 +33,22 @@ def get_workspace_limits(workspace: Workspace) -> dict:
     """Return plan limits and flags for UI (canUseAnimatedHook, maxSocialAccounts, etc.)."""
     limits = workspace.limits or {}
     plan = workspace.plan or "free"
+    # Prefer the generated scalar columns; fall back to the JSON blob for
+    # objects not yet flushed (generated values are computed by Postgres).
+    max_accounts = workspace.max_connected_accounts
+    if max_accounts is None:
+        max_accounts = limits.get("maxConnectedAccounts", 1)
+    max_premium = workspace.max_premium_effects_per_video
+    if max_premium is None:
+        max_premium = limits.get("maxPremiumEffectsPerVideo", 0)
+    max_series = workspace.max_series
+    if max_series is None:
+        max_series = limits.get("maxSeries", 1)
     return {
         "plan": plan,
         "limits": limits,
         "canUseAnimatedHook": plan in ("pro", "agency") and limits.get("canUseAnimatedHook", True),
-        "maxSocialAccounts": limits.get("maxConnectedAccounts", 1),
-        "maxPremiumEffectsPerVideo": limits.get("maxPremiumEffectsPerVideo", 0),
-        "maxSeries": limits.get("maxSeries", 1),
+        "maxSocialAccounts": max_accounts,
+        "maxPremiumEffectsPerVideo": max_premium,
+        "maxSeries": max_series,
     }
@@ -1,38 +1,91 @@
 """Send transactional email (e.g. password reset)."""
 
 import smtplib
+import string
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 from app.config import get_settings
 
-
-def send_password_reset_email(to_email: str, reset_token: str) -> None:
-    """
-    Send email with reset link. Link is frontend_url + password_reset_link_path + ?token=...
-    """
-    settings = get_settings()
-    if not settings.smtp_host:
-        return  # Email not configured; skip silently (token still created)
-    link = f"{settings.frontend_url.rstrip('/')}{settings.password_reset_link_path}?token={reset_token}"
-    subject = "Reset your password"
-    body = f"""Hello,
+# Precompiled at import so burst sends (e.g. a flood of reset requests)
+# don't re-join the body per call.
+_SUBJECT = "Reset your password"
+_BODY_TMPL = string.Template(
+    """Hello,
 
 You requested a password reset. Click the link below to set a new password:
 
-{link}
+$link
 
 This link expires in 60 minutes. If you didn't request this, you can ignore this email.
 """
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = subject
-    msg["From"] = settings.smtp_from
-    msg["To"] = to_email
-    msg.attach(MIMEText(body, "plain"))
+)
+
+
+class _SmtpPool:
+    """Keep one authenticated SMTP session alive across sends.
 
-    with smtplib.SMTP(settings.smtp_host, settings.smtp_port) as smtp:
+    Opening a connection per email pays TCP + STARTTLS + AUTH every time;
+    reusing the session amortizes that across a burst of reset emails.
+    Liveness is checked with NOOP and the session is rebuilt on disconnect.
+    A lock serializes the whole NOOP/send dialogue: smtplib is not
+    thread-safe, and the sync endpoint runs in FastAPI's threadpool.
+    """
+
+    def __init__(self) -> None:
+        self._smtp: smtplib.SMTP | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        settings = get_settings()
+        smtp = smtplib.SMTP(settings.smtp_host, settings.smtp_port)
         if settings.smtp_use_tls:
             smtp.starttls()
         if settings.smtp_user and settings.smtp_password:
             smtp.login(settings.smtp_user, settings.smtp_password)
-        smtp.sendmail(settings.smtp_from, [to_email], msg.as_string())
+        return smtp
+
+    def get(self) -> smtplib.SMTP:
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPServerDisconnected, OSError):
+                self._smtp = None
+        self._smtp = self._connect()
+        return self._smtp
+
+    def sendmail(self, from_email: str, to_emails: list[str], message: str) -> None:
+        with self._lock:
+            try:
+                self.get().sendmail(from_email, to_emails, message)
+            except smtplib.SMTPServerDisconnected:
+                # Server dropped the idle session between NOOP and send; retry once fresh.
+                self._smtp = None
+                self.get().sendmail(from_email, to_emails, message)
+
+
+_smtp_pool = _SmtpPool()
+
+
+def _build_message(to_email: str, from_email: str, body: str) -> MIMEMultipart:
+    """Assemble the plain-text reset message."""
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = _SUBJECT
+    msg["From"] = from_email
+    msg["To"] = to_email
+    msg.attach(MIMEText(body, "plain"))
+    return msg
+
+
+def send_password_reset_email(to_email: str, reset_token: str) -> None:
+    """
+    Send email with reset link. Link is frontend_url + password_reset_link_path + ?token=...
+    """
+    settings = get_settings()
+    if not settings.smtp_host:
+        return  # Email not configured; skip silently (token still created)
+    link = f"{settings.frontend_url.rstrip('/')}{settings.password_reset_link_path}?token={reset_token}"
+    msg = _build_message(to_email, settings.smtp_from, _BODY_TMPL.substitute(link=link))
+    _smtp_pool.sendmail(settings.smtp_from, [to_email], msg.as_string())
@@ -2,7 +2,7 @@ import uuid
 from pathlib import Path
 from typing import Any, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.config import get_settings
 from app.db.models.episode import Episode, Script
@@ -84,10 +84,17 @@ def _episode_context(db: Session, episode: Episode) -> tuple[int, int, Optional[
 
 
 def run_script_generation(db: Session, episode_id: uuid.UUID) -> dict[str, Any]:
-    episode = db.query(Episode).filter(Episode.id == episode_id).first()
+    # One joined SELECT brings the series along with the episode instead of
+    # a second round trip for it.
+    episode = (
+        db.query(Episode)
+        .options(joinedload(Episode.series))
+        .filter(Episode.id == episode_id)
+        .first()
+    )
     if not episode:
         raise ValueError("Episode not found")
-    series = db.query(Series).filter(Series.id == episode.series_id).first()
+    series = episode.series
     if not series:
         raise ValueError("Series not found")
 
@@ -146,11 +153,13 @@ def run_script_generation(db: Session, episode_id: uuid.UUID) -> dict[str, Any]:
                     "topic": plan.topic,
                 },
             )
-            db.add(script)
-            db.flush()
+            # The Script id is generated client-side, so no flush is needed
+            # to learn it; both the INSERT and the Episode UPDATE go out in
+            # the single flush at commit.
             episode.script_id = script.id
             episode.status = "ready_for_review"
             episode.error = None
+            db.add(script)
             db.commit()
             db.refresh(episode)
             return {
@@ -206,12 +215,12 @@ def run_script_generation(db: Session, episode_id: uuid.UUID) -> dict[str, Any]:
             "script_preferences": series.script_preferences,
         },
     )
-    db.add(script)
-    db.flush()
-
+    # Same single-flush pattern as the reel_engine branch above: the client
+    # UUID makes the intermediate flush unnecessary.
     episode.script_id = script.id
     episode.status = "ready_for_review"
     episode.error = None
+    db.add(script)
     db.commit()
     db.refresh(episode)
 
@@ -0,0 +1,195 @@
+"""Submit scheduled script generation through OpenAI's Batch API.
+
+Scheduled episodes don't need interactive latency, so they can ride the Batch
+API's 24-hour completion window for half the token price and a separate
+rate-limit pool. launch_series submits eligible episodes here; the
+poll_script_batches beat task collects finished batches and writes scripts.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import uuid
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.db.models.episode import Episode, Script
+from app.db.models.series import Series
+from app.services.llm_service import (
+    _build_scene_messages,
+    _parse_scene_response,
+    get_openai_client,
+)
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Same scene bounds as the live path in generation_service (2-minute videos).
+_SCENE_MIN, _SCENE_MAX = 12, 20
+
+
+def submit_script_batch(db: Session, series: Series, episodes: list[Episode]) -> Optional[str]:
+    """Submit one batch covering the given episodes; returns the batch id.
+
+    Episodes are paired (1,2), (3,4), ... as 2-part stories, matching the live
+    path. Part 2 prompts can't include the previous part's ending (it doesn't
+    exist yet), so they carry only the continue-the-story instruction.
+    """
+    if not episodes:
+        return None
+    settings = get_settings()
+    voice_language = series.voice_language or {}
+    language_code = voice_language.get("languageCode", "en-US")
+    series_title = (series.name or "").strip() or None
+
+    lines = []
+    for i, ep in enumerate(episodes):
+        episode_index = 2 if i % 2 == 1 else 1
+        total_episodes = 2 if (i % 2 == 1 or i + 1 < len(episodes)) else 1
+        messages = _build_scene_messages(
+            series.content_type,
+            series.custom_topic,
+            language_code=language_code,
+            num_scenes_min=_SCENE_MIN,
+            num_scenes_max=_SCENE_MAX,
+            episode_index=episode_index,
+            total_episodes=total_episodes,
+            series_title=series_title,
+        )
+        lines.append(
+            json.dumps(
+                {
+                    "custom_id": str(ep.id),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": settings.openai_model,
+                        "messages": messages,
+                        "temperature": 0.6,
+                        "max_tokens": 2000,
+                    },
+                }
+            )
+        )
+
+    client = get_openai_client()
+    buf = io.BytesIO("\n".join(lines).encode("utf-8"))
+    batch_file = client.files.create(file=("script_batch.jsonl", buf), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    # One UPDATE keyed by id; also safe for episodes inserted via
+    # bulk_save_objects, which are not tracked by the session.
+    db.query(Episode).filter(Episode.id.in_([ep.id for ep in episodes])).update(
+        {Episode.llm_batch_id: batch.id}, synchronize_session=False
+    )
+    db.commit()
+    logger.info("Submitted script batch %s for %d episodes", batch.id, len(episodes))
+    return batch.id
+
+
+def collect_batch_results(db: Session, batch_id: str) -> int:
+    """Collect a finished batch: write scripts and chain media generation.
+
+    Returns the number of episodes completed. No-op while the batch is still
+    running; on terminal failure, clears llm_batch_id so episodes fall back to
+    the live path via the backfill task.
+    """
+    client = get_openai_client()
+    batch = client.batches.retrieve(batch_id)
+    if batch.status in ("failed", "expired", "cancelled"):
+        logger.warning("Script batch %s ended with status %s; reverting to live path", batch_id, batch.status)
+        db.query(Episode).filter(Episode.llm_batch_id == batch_id).update(
+            {Episode.llm_batch_id: None}, synchronize_session=False
+        )
+        db.commit()
+        return 0
+    if batch.status != "completed" or not batch.output_file_id:
+        return 0
+
+    content = client.files.content(batch.output_file_id).text
+    completed_ids: list[str] = []
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            episode_id = uuid.UUID(record["custom_id"])
+            raw = record["response"]["body"]["choices"][0]["message"]["content"]
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning("Skipping malformed batch line in %s: %s", batch_id, e)
+            continue
+        episode = db.query(Episode).filter(Episode.id == episode_id).first()
+        if not episode or episode.script_id:
+            continue
+        series = db.query(Series).filter(Series.id == episode.series_id).first()
+        if not series:
+            continue
+        try:
+            scenes = _parse_scene_response(raw, _SCENE_MAX)
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.warning("Batch scenes for episode %s invalid: %s", episode_id, e)
+            episode.llm_batch_id = None  # fall back to live generation
+            continue
+        voice_language = series.voice_language or {}
+        script_text = "\n\n".join((s.get("text") or "").strip() for s in scenes)
+        script = Script(
+            id=uuid.uuid4(),
+            series_id=series.id,
+            language_code=voice_language.get("languageCode", "en-US"),
+            text=script_text,
+            scenes=[
+                {"scene": s["scene"], "text": s["text"], "visual_description": s["visual_description"]}
+                for s in scenes
+            ],
+            prompt_metadata={
+                "content_type": series.content_type,
+                "custom_topic": series.custom_topic,
+                "script_preferences": series.script_preferences,
+                "source": "openai_batch",
+                "batch_id": batch_id,
+            },
+        )
+        db.add(script)
+        db.flush()
+        episode.script_id = script.id
+        episode.status = "ready_for_review"
+        episode.error = None
+        episode.llm_batch_id = None
+        completed_ids.append(str(episode_id))
+
+    # A completed batch can still contain per-request failures (reported via
+    # error_file_id, not the output file). Anything still pointing at this
+    # batch got no usable script above; clear the marker so the backfill task
+    # reruns those episodes on the live path — the same fallback as the
+    # terminal-failure branch — instead of stranding them forever.
+    orphaned = (
+        db.query(Episode)
+        .filter(Episode.llm_batch_id == batch_id)
+        .update({Episode.llm_batch_id: None}, synchronize_session=False)
+    )
+    if orphaned:
+        logger.warning(
+            "Script batch %s: %d episodes had no usable result; reverting to live path",
+            batch_id,
+            orphaned,
+        )
+    db.commit()
+
+    # Chain media generation, mirroring the live generate_script task.
+    if completed_ids:
+        settings = get_settings()
+        if getattr(settings, "enable_avatar_mode", False):
+            from app.workers.tasks.avatar import generate_avatar_video as next_task
+        else:
+            from app.workers.tasks.media import generate_media as next_task
+
+        for episode_id_str in completed_ids:
+            next_task.delay(episode_id_str)
+    logger.info("Collected script batch %s: %d episodes completed", batch_id, len(completed_ids))
+    return len(completed_ids)
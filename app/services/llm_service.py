@@ -1,29 +1,185 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from openai import OpenAI
+import httpx
+import orjson
+from openai import AsyncOpenAI, OpenAI
 
 from app.config import get_settings
+from app.core.redis_client import get_redis_text
 from app.schemas.script_scenes import SceneSpec, validate_scenes
 
 logger = logging.getLogger(__name__)
 
+# Static prompt blocks are module constants so every call sends byte-identical
+# prefixes: OpenAI's automatic prompt caching only matches stable prefixes, so
+# keeping the fixed text first (and dynamic topic details at the tail) lets
+# repeat generations hit the prefix cache.
+_CONTENT_TYPE_MAP_SCRIPT = {
+    "motivation": "Create an inspiring motivational short-form video script",
+    "horror": "Create a suspenseful horror story script",
+    "finance": "Create an educational finance tip script",
+    "ai_tech": "Create an engaging AI and technology explainer script",
+    "kids": "Create a fun, educational script suitable for children",
+    "anime": "Create an anime-style narrative script",
+    "custom": "Create a custom content script",
+}
 
-def get_openai_client() -> OpenAI:
+_CONTENT_TYPE_MAP_SCENES = {
+    "motivation": "inspiring motivational short-form video",
+    "horror": "suspenseful horror story",
+    "finance": "educational finance tip",
+    "ai_tech": "engaging AI and technology explainer",
+    "kids": "fun, educational content for children",
+    "anime": "anime-style narrative",
+    "custom": "custom content",
+}
+
+_SYSTEM_PROMPT_SCRIPT = (
+    "You are a professional scriptwriter for short-form video content. "
+    "Create engaging, concise scripts optimized for social media. "
+    "Each script must be specifically about the given series/title—never a generic theme "
+    "(e.g. generic ocean or kids facts) unless the title explicitly calls for it."
+)
+
+_SYSTEM_PROMPT_SCENES = (
+    "You are a professional scriptwriter for short vertical videos (Reels/TikTok). "
+    "Output ONLY a valid JSON array of scenes. No markdown, no code fence, no explanation. "
+    "Each script must be specifically about the given series/title—never a generic theme "
+    "(e.g. generic ocean or kids facts) unless the title explicitly calls for it."
+)
+
+_SCRIPT_CLOSING_INSTRUCTION = (
+    "Write only the script text, no stage directions or notes. "
+    "Make it engaging and suitable for a short-form video. "
+    "Avoid repeating the same type of content (e.g. same 'fun facts' style) across episodes; "
+    "keep this story specific to its title."
+)
+
+# Fixed per-scene format spec, sent verbatim before the variable theme details.
+_SCENES_FORMAT_SPEC = (
+    "Split the script into short scenes. For each scene provide: "
+    '"scene" (1-based index), '
+    '"text" (the exact narration for that scene, one or two sentences), '
+    '"visual_description" (short cinematic visual for that moment: setting, mood. '
+    "MUST contain no text/letters/words/subtitles/signage/watermarks). "
+    "Keep visual_description under 100 words, cinematic and concrete. "
+    "Output a JSON array only, e.g. "
+    '[{"scene":1,"text":"...","visual_description":"..."}, ...] '
+    "Avoid repeating the same subject matter across episodes; keep this story specific to its title."
+)
+
+
+# ---------------------------------------------------------------------------
+# Response cache: identical prompts (same model + messages) return the stored
+# scenes straight from Redis, skipping the OpenAI round-trip entirely. Keys
+# hash the full message list, so distinct series titles never collide.
+# ---------------------------------------------------------------------------
+
+_SCENE_CACHE_PREFIX = "llm:scenes:"
+
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*")
+
+
+def _scene_cache_key(model: str, messages: List[Dict[str, str]]) -> str:
+    digest = hashlib.sha256(
+        orjson.dumps({"model": model, "messages": messages}, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+    return _SCENE_CACHE_PREFIX + digest
+
+
+def _scene_cache_get(key: str) -> Optional[List[SceneSpec]]:
+    try:
+        value = get_redis_text().get(key)
+    except Exception:
+        return None  # cache is best-effort; Redis being down never blocks generation
+    if value is None:
+        return None
+    try:
+        scenes = validate_scenes(orjson.loads(value))
+    except ValueError:
+        return None
+    logger.info("Scene cache hit (%d scenes)", len(scenes))
+    return scenes
+
+
+def _scene_cache_set(key: str, scenes: List[SceneSpec]) -> None:
+    settings = get_settings()
+    try:
+        get_redis_text().setex(key, settings.llm_scene_cache_ttl_seconds, orjson.dumps(scenes))
+    except Exception:
+        pass
+
+
+_TEXT_CACHE_PREFIX = "llm:script:"
+
+
+def _text_cache_key(model: str, messages: List[Dict[str, str]]) -> str:
+    digest = hashlib.sha256(
+        orjson.dumps({"model": model, "messages": messages}, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+    return _TEXT_CACHE_PREFIX + digest
+
+
+def _text_cache_get(key: str) -> Optional[str]:
+    try:
+        value = get_redis_text().get(key)
+    except Exception:
+        return None
+    if value:
+        logger.info("Script text cache hit (%d chars)", len(value))
+    return value
+
+
+def _text_cache_set(key: str, text: str) -> None:
+    settings = get_settings()
+    try:
+        get_redis_text().setex(key, settings.llm_scene_cache_ttl_seconds, text)
+    except Exception:
+        pass
+
+
+def _client_kwargs() -> dict:
     settings = get_settings()
     client_kwargs = {
         "api_key": settings.openai_api_key,
     }
     if settings.openai_base_url:
         client_kwargs["base_url"] = settings.openai_base_url
-    return OpenAI(**client_kwargs)
+    return client_kwargs
 
 
-def generate_script_text(
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """One sync client per worker process so every call reuses the same
+    keep-alive connections instead of paying a fresh TLS handshake.
+
+    The async client is deliberately NOT cached: Celery tasks run under
+    asyncio.run, so a cached AsyncOpenAI would hold sockets bound to a
+    dead event loop.
+    """
+    return OpenAI(**_client_kwargs())
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """Async client with explicit pool limits so bulk generation reuses
+    connections instead of hitting httpx's default concurrency cliff."""
+    return AsyncOpenAI(
+        **_client_kwargs(),
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        ),
+    )
+
+
+def _build_script_messages(
     content_type: str,
     custom_topic: Optional[Dict[str, Any]],
     script_preferences: Optional[Dict[str, Any]],
@@ -32,25 +188,15 @@ def generate_script_text(
     total_episodes: int = 1,
     previous_episode_summary: Optional[str] = None,
     series_title: Optional[str] = None,
-) -> str:
-    settings = get_settings()
-    if not settings.openai_api_key:
-        raise ValueError(
-            "OPENAI_API_KEY is not set. Add OPENAI_API_KEY=your_key to your .env file to enable script generation."
-        )
-    client = get_openai_client()
-    prompt_parts = []
-    content_type_map = {
-        "motivation": "Create an inspiring motivational short-form video script",
-        "horror": "Create a suspenseful horror story script",
-        "finance": "Create an educational finance tip script",
-        "ai_tech": "Create an engaging AI and technology explainer script",
-        "kids": "Create a fun, educational script suitable for children",
-        "anime": "Create an anime-style narrative script",
-        "custom": "Create a custom content script",
-    }
-    base_prompt = content_type_map.get(content_type, "Create a video script")
-    
+) -> List[Dict[str, str]]:
+    """Build the chat messages for full-script generation (shared by sync/async paths).
+
+    The static instruction block leads the user message and the variable topic
+    details follow, so repeat calls share a stable prefix for prompt caching.
+    """
+    prompt_parts = [_SCRIPT_CLOSING_INSTRUCTION]
+    base_prompt = _CONTENT_TYPE_MAP_SCRIPT.get(content_type, "Create a video script")
+
     topic_anchor = (series_title or "").strip() or (
         (custom_topic or {}).get("topicTitle", "") if isinstance(custom_topic, dict) else ""
     )
@@ -121,67 +267,146 @@ def generate_script_text(
                     f"How the previous part ended (continue from here):\n\"\"\"\n{previous_episode_summary.strip()}\n\"\"\""
                 )
 
-    prompt_parts.append(
-        "Write only the script text, no stage directions or notes. "
-        "Make it engaging and suitable for a short-form video. "
-        "Avoid repeating the same type of content (e.g. same 'fun facts' style) across episodes; keep this story specific to its title."
-    )
-    
     full_prompt = "\n".join(prompt_parts)
-    
+
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT_SCRIPT},
+        {"role": "user", "content": full_prompt},
+    ]
+
+
+def _log_cached_tokens(response: Any) -> None:
+    """Debug-log prefix-cache hits so caching regressions are visible."""
+    details = getattr(getattr(response, "usage", None), "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None)
+    if cached:
+        logger.debug("Prompt cache hit: %d cached prompt tokens", cached)
+
+
+def _require_openai_key() -> None:
+    if not get_settings().openai_api_key:
+        raise ValueError(
+            "OPENAI_API_KEY is not set. Add OPENAI_API_KEY=your_key to your .env file to enable script generation."
+        )
+
+
+def generate_script_text(
+    content_type: str,
+    custom_topic: Optional[Dict[str, Any]],
+    script_preferences: Optional[Dict[str, Any]],
+    language_code: str = "en-US",
+    episode_index: int = 1,
+    total_episodes: int = 1,
+    previous_episode_summary: Optional[str] = None,
+    series_title: Optional[str] = None,
+) -> str:
+    settings = get_settings()
+    _require_openai_key()
+    client = get_openai_client()
+    messages = _build_script_messages(
+        content_type,
+        custom_topic,
+        script_preferences,
+        language_code=language_code,
+        episode_index=episode_index,
+        total_episodes=total_episodes,
+        previous_episode_summary=previous_episode_summary,
+        series_title=series_title,
+    )
+    cache_key = None
+    if settings.llm_scene_cache_ttl_seconds > 0:
+        cache_key = _text_cache_key(settings.openai_model, messages)
+        cached = _text_cache_get(cache_key)
+        if cached is not None:
+            return cached
     try:
         response = client.chat.completions.create(
             model=settings.openai_model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional scriptwriter for short-form video content. "
-                    "Create engaging, concise scripts optimized for social media. "
-                    "Each script must be specifically about the given series/title—never a generic theme (e.g. generic ocean or kids facts) unless the title explicitly calls for it.",
-                },
-                {"role": "user", "content": full_prompt},
-            ],
+            messages=messages,
             temperature=0.7,
             max_tokens=2500,
         )
-        
+
+        _log_cached_tokens(response)
         script_text = response.choices[0].message.content.strip()
         logger.info(f"Generated script (length: {len(script_text)} chars)")
+        if cache_key:
+            _text_cache_set(cache_key, script_text)
         return script_text
-        
+
     except Exception as e:
         logger.error(f"OpenAI API error: {e}", exc_info=True)
         raise ValueError(f"Failed to generate script: {str(e)}")
 
 
-def generate_script_scenes(
+async def generate_script_text_stream(
     content_type: str,
     custom_topic: Optional[Dict[str, Any]],
     script_preferences: Optional[Dict[str, Any]],
     language_code: str = "en-US",
-    num_scenes_min: int = 5,
-    num_scenes_max: int = 12,
     episode_index: int = 1,
     total_episodes: int = 1,
     previous_episode_summary: Optional[str] = None,
     series_title: Optional[str] = None,
-) -> List[SceneSpec]:
+    client: Optional[AsyncOpenAI] = None,
+) -> AsyncIterator[str]:
+    """Stream script text as it is decoded, yielding content deltas.
+
+    Lets callers overlap downstream work (scene detection, TTS) with the LLM
+    decode instead of waiting for the full completion; generate_script_text
+    remains the buffered path for callers that need the whole script.
+    """
     settings = get_settings()
-    if not settings.openai_api_key:
-        raise ValueError(
-            "OPENAI_API_KEY is not set. Add OPENAI_API_KEY=your_key to your .env file."
+    _require_openai_key()
+    owns_client = client is None
+    if client is None:
+        client = get_async_openai_client()
+    messages = _build_script_messages(
+        content_type,
+        custom_topic,
+        script_preferences,
+        language_code=language_code,
+        episode_index=episode_index,
+        total_episodes=total_episodes,
+        previous_episode_summary=previous_episode_summary,
+        series_title=series_title,
+    )
+    try:
+        stream = await client.chat.completions.create(
+            model=settings.openai_model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=2500,
+            stream=True,
         )
-    client = get_openai_client()
-    content_type_map = {
-        "motivation": "inspiring motivational short-form video",
-        "horror": "suspenseful horror story",
-        "finance": "educational finance tip",
-        "ai_tech": "engaging AI and technology explainer",
-        "kids": "fun, educational content for children",
-        "anime": "anime-style narrative",
-        "custom": "custom content",
-    }
-    theme = content_type_map.get(content_type, "short-form video")
+        async for chunk in stream:
+            if chunk.choices and (delta := chunk.choices[0].delta.content):
+                yield delta
+    except Exception as e:
+        logger.error("OpenAI API error in generate_script_text_stream: %s", e, exc_info=True)
+        raise ValueError(f"Failed to generate script: {str(e)}") from e
+    finally:
+        if owns_client:
+            await client.close()
+
+
+def _build_scene_messages(
+    content_type: str,
+    custom_topic: Optional[Dict[str, Any]],
+    language_code: str = "en-US",
+    num_scenes_min: int = 5,
+    num_scenes_max: int = 12,
+    episode_index: int = 1,
+    total_episodes: int = 1,
+    previous_episode_summary: Optional[str] = None,
+    series_title: Optional[str] = None,
+) -> List[Dict[str, str]]:
+    """Build the chat messages for scene generation (shared by sync/async paths).
+
+    The fixed format spec leads the user message and the variable theme/length
+    details follow, so repeat calls share a stable prefix for prompt caching.
+    """
+    theme = _CONTENT_TYPE_MAP_SCENES.get(content_type, "short-form video")
     if content_type == "custom" and custom_topic:
         theme = f"custom: {custom_topic.get('topicTitle', theme)}"
     topic_anchor = (series_title or "").strip()
@@ -191,21 +416,10 @@ def generate_script_scenes(
     # We generate 2-minute videos only
     length_sec = "about 2 minutes"
 
-    system = (
-        "You are a professional scriptwriter for short vertical videos (Reels/TikTok). "
-        "Output ONLY a valid JSON array of scenes. No markdown, no code fence, no explanation. "
-        "Each script must be specifically about the given series/title—never a generic theme (e.g. generic ocean or kids facts) unless the title explicitly calls for it."
-    )
     user = (
+        f"{_SCENES_FORMAT_SPEC} "
         f"Create a {theme} script for {length_sec} of spoken content. "
-        f"Split it into exactly {num_scenes_min} to {num_scenes_max} short scenes. "
-        "For each scene provide: "
-        '"scene" (1-based index), '
-        '"text" (the exact narration for that scene, one or two sentences), '
-        '"visual_description" (short cinematic visual for that moment: setting, mood. MUST contain no text/letters/words/subtitles/signage/watermarks). '
-        "Keep visual_description under 100 words, cinematic and concrete. "
-        "Output a JSON array only, e.g. [{\"scene\":1,\"text\":\"...\",\"visual_description\":\"...\"}, ...] "
-        "Avoid repeating the same subject matter across episodes; keep this story specific to its title."
+        f"Split it into exactly {num_scenes_min} to {num_scenes_max} short scenes."
     )
     if total_episodes > 1:
         if episode_index <= 1:
@@ -223,25 +437,73 @@ def generate_script_scenes(
     if language_code and language_code != "en-US":
         user += f" Language for narration: {language_code}."
 
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT_SCENES},
+        {"role": "user", "content": user},
+    ]
+
+
+def _parse_scene_response(raw: str, num_scenes_max: int) -> List[SceneSpec]:
+    """Parse and validate the LLM's JSON scene array."""
+    raw = raw.strip()
+    if raw.startswith("```"):
+        raw = _CODE_FENCE_RE.sub("", raw)
+        raw = raw.rstrip("`").strip()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers'
+    # except clauses keep working.
+    data = orjson.loads(raw)
+    # Trim overshoot before validation so normalization work stops at the cap
+    # instead of validating scenes we're about to discard.
+    if isinstance(data, list) and len(data) > num_scenes_max:
+        data = data[:num_scenes_max]
+    scenes = validate_scenes(data)
+    logger.info("Generated %d scenes for scene-based pipeline", len(scenes))
+    return scenes
+
+
+def generate_script_scenes(
+    content_type: str,
+    custom_topic: Optional[Dict[str, Any]],
+    script_preferences: Optional[Dict[str, Any]],
+    language_code: str = "en-US",
+    num_scenes_min: int = 5,
+    num_scenes_max: int = 12,
+    episode_index: int = 1,
+    total_episodes: int = 1,
+    previous_episode_summary: Optional[str] = None,
+    series_title: Optional[str] = None,
+) -> List[SceneSpec]:
+    settings = get_settings()
+    _require_openai_key()
+    client = get_openai_client()
+    messages = _build_scene_messages(
+        content_type,
+        custom_topic,
+        language_code=language_code,
+        num_scenes_min=num_scenes_min,
+        num_scenes_max=num_scenes_max,
+        episode_index=episode_index,
+        total_episodes=total_episodes,
+        previous_episode_summary=previous_episode_summary,
+        series_title=series_title,
+    )
+    cache_key = None
+    if settings.llm_scene_cache_ttl_seconds > 0:
+        cache_key = _scene_cache_key(settings.openai_model, messages)
+        cached = _scene_cache_get(cache_key)
+        if cached is not None:
+            return cached[:num_scenes_max]
     try:
         response = client.chat.completions.create(
             model=settings.openai_model,
-            messages=[
-                {"role": "system", "content": system},
-                {"role": "user", "content": user},
-            ],
+            messages=messages,
             temperature=0.6,
             max_tokens=2000,
         )
-        raw = response.choices[0].message.content.strip()
-        if raw.startswith("```"):
-            raw = re.sub(r"^```(?:json)?\s*", "", raw)
-            raw = raw.rstrip("`").strip()
-        data = json.loads(raw)
-        scenes = validate_scenes(data)
-        if len(scenes) > num_scenes_max:
-            scenes = scenes[:num_scenes_max]
-        logger.info("Generated %d scenes for scene-based pipeline", len(scenes))
+        _log_cached_tokens(response)
+        scenes = _parse_scene_response(response.choices[0].message.content, num_scenes_max)
+        if cache_key:
+            _scene_cache_set(cache_key, scenes)
         return scenes
     except json.JSONDecodeError as e:
         logger.warning("LLM returned invalid JSON: %s", e)
@@ -249,3 +511,87 @@ def generate_script_scenes(
     except Exception as e:
         logger.error("OpenAI API error in generate_script_scenes: %s", e, exc_info=True)
         raise ValueError(f"Failed to generate script scenes: {str(e)}") from e
+
+
+async def generate_script_scenes_async(
+    content_type: str,
+    custom_topic: Optional[Dict[str, Any]],
+    script_preferences: Optional[Dict[str, Any]],
+    language_code: str = "en-US",
+    num_scenes_min: int = 5,
+    num_scenes_max: int = 12,
+    episode_index: int = 1,
+    total_episodes: int = 1,
+    previous_episode_summary: Optional[str] = None,
+    series_title: Optional[str] = None,
+    client: Optional[AsyncOpenAI] = None,
+) -> List[SceneSpec]:
+    """Async twin of generate_script_scenes; pass a shared client when fanning out."""
+    settings = get_settings()
+    _require_openai_key()
+    owns_client = client is None
+    if client is None:
+        client = get_async_openai_client()
+    messages = _build_scene_messages(
+        content_type,
+        custom_topic,
+        language_code=language_code,
+        num_scenes_min=num_scenes_min,
+        num_scenes_max=num_scenes_max,
+        episode_index=episode_index,
+        total_episodes=total_episodes,
+        previous_episode_summary=previous_episode_summary,
+        series_title=series_title,
+    )
+    cache_key = None
+    if settings.llm_scene_cache_ttl_seconds > 0:
+        cache_key = _scene_cache_key(settings.openai_model, messages)
+        cached = _scene_cache_get(cache_key)
+        if cached is not None:
+            if owns_client:
+                await client.close()
+            return cached[:num_scenes_max]
+    try:
+        response = await client.chat.completions.create(
+            model=settings.openai_model,
+            messages=messages,
+            temperature=0.6,
+            max_tokens=2000,
+        )
+        _log_cached_tokens(response)
+        scenes = _parse_scene_response(response.choices[0].message.content, num_scenes_max)
+        if cache_key:
+            _scene_cache_set(cache_key, scenes)
+        return scenes
+    except json.JSONDecodeError as e:
+        logger.warning("LLM returned invalid JSON: %s", e)
+        raise ValueError("Script scenes response was not valid JSON") from e
+    except Exception as e:
+        logger.error("OpenAI API error in generate_script_scenes_async: %s", e, exc_info=True)
+        raise ValueError(f"Failed to generate script scenes: {str(e)}") from e
+    finally:
+        if owns_client:
+            await client.close()
+
+
+async def generate_scripts_bulk(specs: List[Dict[str, Any]]) -> List[List[SceneSpec]]:
+    """Generate scenes for many episodes concurrently over one pooled client.
+
+    Each spec is a kwargs dict for generate_script_scenes_async. Concurrency is
+    bounded by settings.openai_concurrency so a big series launch doesn't
+    stampede the API; total latency drops from the sum of calls to roughly the
+    slowest one.
+    """
+    settings = get_settings()
+    _require_openai_key()
+    semaphore = asyncio.Semaphore(max(1, settings.openai_concurrency))
+    client = get_async_openai_client()
+
+    async def _one(spec: Dict[str, Any]) -> List[SceneSpec]:
+        async with semaphore:
+            return await generate_script_scenes_async(**spec, client=client)
+
+    try:
+        return list(await asyncio.gather(*[_one(s) for s in specs]))
+    finally:
+        await client.close()
@@ -1,8 +1,17 @@
-"""Platform-specific video publish: TikTok, Instagram, YouTube, Facebook."""
+"""Platform-specific video publish: TikTok, Instagram, YouTube, Facebook.
 
+All network calls are async over one pooled httpx.AsyncClient per publish, so
+multi-step flows like the Instagram container poll reuse a single TCP+TLS
+connection instead of opening a fresh one per request.
+"""
+
+import asyncio
+import random
 import time
+from functools import lru_cache
 from typing import Any, Optional
 import httpx
+import orjson
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
@@ -11,8 +20,88 @@ from app.db.models.asset import Asset
 from app.db.models.social_account import SocialAccount
 from app.services.storage_service import get_download_url
 
+_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+_HTTP_TIMEOUT = httpx.Timeout(60, connect=10)
+
+
+def _make_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+
+
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 5
+
+
+async def _request_with_retry(http: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a request, retrying transient failures with backoff + jitter.
+
+    Retries 429/5xx responses and transport errors (connection reset etc.) so
+    a momentary platform hiccup doesn't fail the whole publish and force the
+    Celery task to restart from scratch. Honors Retry-After when present and
+    reuses the shared client's keep-alive connection across attempts. Other
+    4xx responses raise immediately via raise_for_status.
+    """
+    delay = 1.0
+    for attempt in range(1, _RETRY_ATTEMPTS + 1):
+        try:
+            r = await http.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if attempt == _RETRY_ATTEMPTS:
+                raise
+        else:
+            if r.status_code not in _RETRY_STATUS or attempt == _RETRY_ATTEMPTS:
+                r.raise_for_status()
+                return r
+            retry_after = r.headers.get("retry-after")
+            if retry_after:
+                try:
+                    delay = max(delay, float(retry_after))
+                except ValueError:
+                    pass
+        await asyncio.sleep(delay + random.uniform(0, delay / 2))
+        delay = min(delay * 2, 30.0)
+    raise RuntimeError("unreachable")  # loop always returns or raises
+
+
+# Decrypted-token cache keyed by ciphertext: a weekly series posting to a few
+# platforms decrypts the same handful of tokens dozens of times. Keying on the
+# ciphertext makes rotation safe automatically (a rotated token is a new
+# ciphertext); the TTL just bounds memory and staleness.
+_TOKEN_CACHE: dict[str, tuple[float, str]] = {}
+_TOKEN_CACHE_TTL = 600.0
+_TOKEN_CACHE_MAX = 512
+
 
-def _tiktok_publish(
+def _decrypt_token_cached(encrypted: str) -> str:
+    now = time.monotonic()
+    hit = _TOKEN_CACHE.get(encrypted)
+    if hit is not None and now - hit[0] < _TOKEN_CACHE_TTL:
+        return hit[1]
+    plain = decrypt_token(encrypted)
+    if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+        _TOKEN_CACHE.clear()
+    _TOKEN_CACHE[encrypted] = (now, plain)
+    return plain
+
+
+# Presigning is pure HMAC math but adds up across the per-post task fanout,
+# which signs the same video once per connected account. Bucketing the cache
+# key by 15-minute windows bounds staleness: a cached URL is at most 900 s
+# old against a 7200 s expiry.
+_PRESIGN_BUCKET_SECONDS = 900
+
+
+@lru_cache(maxsize=256)
+def _presign_bucketed(url: str, bucket: int) -> str:
+    return get_download_url(url, expiration=7200)
+
+
+def _presigned_video_url(url: str) -> str:
+    return _presign_bucketed(url, int(time.time() // _PRESIGN_BUCKET_SECONDS))
+
+
+async def _tiktok_publish(
+    http: httpx.AsyncClient,
     access_token: str,
     video_url: str,
     caption: str,
@@ -39,14 +128,15 @@ def _tiktok_publish(
             "video_url": video_url,
         },
     }
-    r = httpx.post(
+    r = await _request_with_retry(
+        http,
+        "POST",
         "https://open.tiktokapis.com/v2/post/publish/video/init/",
         headers=headers,
-        json=init_payload,
+        content=orjson.dumps(init_payload),
         timeout=30,
     )
-    r.raise_for_status()
-    data = r.json()
+    data = orjson.loads(r.content)
     err = data.get("error") or {}
     if err.get("code") and err.get("code") != "ok":
         raise RuntimeError(err.get("message", "TikTok init failed"))
@@ -56,7 +146,8 @@ def _tiktok_publish(
     return {"platform_post_id": publish_id, "status": "posted"}
 
 
-def _instagram_publish(
+async def _instagram_publish(
+    http: httpx.AsyncClient,
     access_token: str,
     video_url: str,
     caption: str,
@@ -66,7 +157,9 @@ def _instagram_publish(
     Uses Instagram API with Instagram Login (business).
     """
     # Create media container (video)
-    r = httpx.post(
+    r = await _request_with_retry(
+        http,
+        "POST",
         "https://graph.facebook.com/v21.0/me/media",
         params={"access_token": access_token},
         json={
@@ -76,39 +169,53 @@ def _instagram_publish(
         },
         timeout=60,
     )
-    r.raise_for_status()
-    data = r.json()
+    data = orjson.loads(r.content)
     container_id = data.get("id")
     if not container_id:
         raise RuntimeError("No container id from Instagram")
 
-    # Poll until container is ready then publish
-    for _ in range(30):
-        check = httpx.get(
+    # Poll until container is ready then publish. First check is immediate for
+    # the common already-done case; after that back off exponentially (capped)
+    # and honor Retry-After, instead of hammering Graph API every 2s.
+    delay = 1.0
+    deadline = asyncio.get_event_loop().time() + 120
+    while True:
+        check = await _request_with_retry(
+            http,
+            "GET",
             f"https://graph.facebook.com/v21.0/{container_id}",
             params={"access_token": access_token, "fields": "status_code"},
             timeout=10,
         )
-        check.raise_for_status()
-        status = check.json().get("status_code")
+        status = orjson.loads(check.content).get("status_code")
         if status == "FINISHED":
             break
         if status == "ERROR":
             raise RuntimeError("Instagram container processing failed")
-        time.sleep(2)
+        if asyncio.get_event_loop().time() >= deadline:
+            raise RuntimeError("Instagram container processing timed out")
+        retry_after = check.headers.get("retry-after")
+        try:
+            wait = float(retry_after) if retry_after else delay
+        except ValueError:
+            wait = delay
+        await asyncio.sleep(wait)
+        delay = min(delay * 1.5, 8.0)
 
-    pub = httpx.post(
+    pub = await _request_with_retry(
+        http,
+        "POST",
         f"https://graph.facebook.com/v21.0/me/media_publish",
         params={"access_token": access_token, "creation_id": container_id},
         timeout=30,
     )
-    pub.raise_for_status()
-    pub_data = pub.json()
+    pub_data = orjson.loads(pub.content)
     media_id = pub_data.get("id")
     return {"platform_post_id": media_id or container_id, "status": "posted"}
 
 
-def _youtube_publish(
+async def _youtube_publish(
+    http: httpx.AsyncClient,
     access_token: str,
     video_url: str,
     title: str,
@@ -120,16 +227,13 @@ def _youtube_publish(
     to download the file and use resumable upload. Simplified: attempt insert
     with upload URL (YouTube may not support URL ingest); else fail with clear message.
     """
-    r = httpx.get(video_url, timeout=120)
-    r.raise_for_status()
-    video_bytes = r.content
-    content_type = "video/mp4"
-
     headers = {
         "Authorization": f"Bearer {access_token}",
         "Content-Type": "application/json",
     }
-    init = httpx.post(
+    init = await _request_with_retry(
+        http,
+        "POST",
         "https://www.googleapis.com/upload/youtube/v3/videos?uploadType=resumable&part=snippet,status",
         headers=headers,
         json={
@@ -142,69 +246,98 @@ def _youtube_publish(
         },
         timeout=30,
     )
-    init.raise_for_status()
     upload_url = init.headers.get("location")
     if not upload_url:
         raise RuntimeError("YouTube did not return upload URL")
 
-    up = httpx.put(upload_url, content=video_bytes, headers={"Content-Type": content_type}, timeout=300)
+    # Pipe the S3 download straight into the resumable PUT in 1 MB chunks so
+    # memory stays O(chunk) instead of holding the whole video twice. The PUT
+    # is deliberately single-shot: its streaming body can't be replayed, so it
+    # stays outside _request_with_retry.
+    async with http.stream("GET", video_url, timeout=300) as src:
+        src.raise_for_status()
+        upload_headers = {"Content-Type": "video/mp4"}
+        content_length = src.headers.get("content-length")
+        if content_length:
+            upload_headers["Content-Length"] = content_length
+        up = await http.put(
+            upload_url,
+            content=src.aiter_bytes(chunk_size=1 << 20),
+            headers=upload_headers,
+            timeout=300,
+        )
     up.raise_for_status()
-    out = up.json()
+    out = orjson.loads(up.content)
     video_id = out.get("id")
     if not video_id:
         raise RuntimeError("YouTube upload response missing id")
     return {"platform_post_id": video_id, "status": "posted"}
 
 
-def _facebook_publish(
+async def _facebook_publish(
+    http: httpx.AsyncClient,
     access_token: str,
     video_url: str,
     caption: str,
 ) -> dict[str, Any]:
     """Facebook Graph: publish video to page or user feed."""
-    r = httpx.post(
+    r = await _request_with_retry(
+        http,
+        "POST",
         "https://graph.facebook.com/v21.0/me/videos",
         params={"access_token": access_token},
         data={"file_url": video_url, "description": (caption or "")[:5000]},
         timeout=60,
     )
-    r.raise_for_status()
-    data = r.json()
+    data = orjson.loads(r.content)
     video_id = data.get("id")
     return {"platform_post_id": video_id or "unknown", "status": "posted"}
 
 
-def publish_to_platform(
+async def publish_to_platform(
     db: Session,
     social_account: SocialAccount,
     video_asset: Asset,
     caption: str,
     post_id: str,
+    http: Optional[httpx.AsyncClient] = None,
+    video_url: Optional[str] = None,
 ) -> tuple[str, Optional[str], Optional[dict]]:
     """
     Publish video to the given social account. Returns (status, platform_post_id, error_dict).
-    status is "posted" or "failed".
+    status is "posted" or "failed". Callers that already hold a client or a
+    presigned URL can pass them in; otherwise the presign comes from the
+    time-bucketed cache shared across the per-post task fanout.
     """
     platform = (social_account.platform or "").lower()
-    access_token = decrypt_token(social_account.access_token or "")
+    access_token = _decrypt_token_cached(social_account.access_token or "")
     if not access_token:
         return "failed", None, {"message": "Missing or invalid access token"}
 
-    video_url = get_download_url(video_asset.url, expiration=7200) if video_asset.url else ""
+    if video_url is None:
+        video_url = _presigned_video_url(video_asset.url) if video_asset.url else ""
     if not video_url or video_url.startswith("https://storage.example.com"):
         return "failed", None, {"message": "Video URL not available (S3 not configured or placeholder)"}
 
+    owns_client = http is None
+    if http is None:
+        http = _make_http_client()
     try:
         if platform == "tiktok":
-            out = _tiktok_publish(access_token, video_url, caption or "Video", post_id)
+            out = await _tiktok_publish(http, access_token, video_url, caption or "Video", post_id)
         elif platform == "instagram":
-            out = _instagram_publish(access_token, video_url, caption)
+            out = await _instagram_publish(http, access_token, video_url, caption)
         elif platform == "youtube":
-            out = _youtube_publish(access_token, video_url, caption or "Video", caption or "")
+            out = await _youtube_publish(http, access_token, video_url, caption or "Video", caption or "")
         elif platform == "facebook":
-            out = _facebook_publish(access_token, video_url, caption)
+            out = await _facebook_publish(http, access_token, video_url, caption)
         else:
             return "failed", None, {"message": f"Unsupported platform: {platform}"}
         return out.get("status", "posted"), out.get("platform_post_id"), None
     except Exception as e:
         return "failed", None, {"message": str(e)}
+    finally:
+        if owns_client:
+            await http.aclose()
+
+
@@ -3,10 +3,24 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Optional
 from zoneinfo import ZoneInfo
 
 
+@lru_cache(maxsize=256)
+def _get_zoneinfo(tz_name: str):
+    """ZoneInfo construction re-parses tzdata; cache per name.
+
+    The UTC fallback lives inside the cached function so an invalid name is
+    resolved (and cached) once — lru_cache does not memoize exceptions.
+    """
+    try:
+        return ZoneInfo(tz_name)
+    except Exception:
+        return timezone.utc
+
+
 def _parse_time(s: str) -> tuple[int, int]:
     """Parse 'HH:MM' or 'HH:MM:SS' to (hour, minute)."""
     parts = (s or "09:00").strip().split(":")
@@ -24,14 +38,20 @@ def _parse_start_date(start_date: Any) -> Optional[datetime]:
             return start_date.replace(tzinfo=timezone.utc)
         return start_date
     if isinstance(start_date, str):
+        # fromisoformat is C-implemented and covers the ISO-8601 strings the
+        # frontend sends; dateutil's regex parser is kept only as a fallback
+        # for anything looser.
         try:
-            from dateutil import parser as dateutil_parser
-            parsed = dateutil_parser.parse(start_date)
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            return parsed
-        except Exception:
-            return None
+            parsed = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
+        except ValueError:
+            try:
+                from dateutil import parser as dateutil_parser
+                parsed = dateutil_parser.parse(start_date)
+            except Exception:
+                return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
     return None
 
 
@@ -50,32 +70,49 @@ def get_next_publish_slots(
     start_date = _parse_start_date(schedule.get("startDate"))
     custom_days = schedule.get("customDays")
 
-    try:
-        tz = ZoneInfo(tz_name)
-    except Exception:
-        tz = timezone.utc
-    now = datetime.now(timezone.utc)
-    start = start_date.astimezone(tz) if start_date and start_date.tzinfo else now.astimezone(tz)
-    if start < now.astimezone(tz):
-        start = now.astimezone(tz)
+    tz = _get_zoneinfo(tz_name)
+    # Anchor and "now" are converted to the target zone once; the loop below
+    # does pure day arithmetic and converts each accepted slot to UTC once,
+    # instead of re-running zoneinfo transitions on every iteration.
+    now_local = datetime.now(timezone.utc).astimezone(tz)
+    start = start_date.astimezone(tz) if start_date and start_date.tzinfo else now_local
+    if start < now_local:
+        start = now_local
     hour, minute = _parse_time(publish_time)
-    slots = []
-    day_offset = 0
+    anchor = start.replace(hour=hour, minute=minute, second=0, microsecond=0)
     max_days = 365
-    while len(slots) < count and day_offset < max_days:
-        candidate = start.replace(hour=hour, minute=minute, second=0, microsecond=0) + timedelta(days=day_offset)
-        if candidate < now.astimezone(tz):
-            day_offset += 1
-            continue
-        if frequency == "daily":
-            slots.append(candidate.astimezone(timezone.utc))
-        elif frequency == "weekly":
-            if custom_days is not None and len(custom_days) > 0:
-                if candidate.weekday() in custom_days:
-                    slots.append(candidate.astimezone(timezone.utc))
-            else:
-                slots.append(candidate.astimezone(timezone.utc))
-        else:
-            slots.append(candidate.astimezone(timezone.utc))
-        day_offset += 1
-    return slots[:count]
+
+    # First day offset whose slot is not in the past, computed in O(1) (the
+    # +1 correction covers a partial trailing day).
+    first_offset = max(0, (now_local - anchor).days)
+    if anchor + timedelta(days=first_offset) < now_local:
+        first_offset += 1
+
+    custom_day_set = frozenset(custom_days) if frequency == "weekly" and custom_days else None
+    if custom_day_set is None:
+        # Daily (and weekly-without-customDays) emits every day: generate
+        # exactly `count` slots directly instead of scanning day by day.
+        return [
+            (anchor + timedelta(days=first_offset + i)).astimezone(timezone.utc)
+            for i in range(count)
+            if first_offset + i < max_days
+        ]
+
+    # Weekly with specific weekdays: precompute each target weekday's first
+    # occurrence relative to the anchor, then step week by week.
+    start_weekday = anchor.weekday()
+    day_offsets = sorted({(wd - start_weekday) % 7 for wd in custom_day_set if isinstance(wd, int)})
+    slots = []
+    # Jump straight to the first week that can contain a future slot instead
+    # of skipping earlier weeks one offset at a time.
+    week = first_offset // 7
+    while day_offsets and len(slots) < count and week * 7 < max_days:
+        for off in day_offsets:
+            day_offset = week * 7 + off
+            if day_offset < first_offset or day_offset >= max_days:
+                continue
+            slots.append((anchor + timedelta(days=day_offset)).astimezone(timezone.utc))
+            if len(slots) >= count:
+                break
+        week += 1
+    return slots
@@ -6,10 +6,11 @@ from typing import Any, Optional
 
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.db.models.series import Series
 from app.db.models.episode import Episode, Script
 from app.db.models.workspace import Workspace
-from app.services.credits_service import estimate_credits_per_episode
+from app.services.credits_service import count_premium_effects, estimate_credits_per_episode
 from app.services.schedule_slots import get_next_publish_slots
 
 
@@ -62,6 +63,67 @@ def _apply_json_update(current: Optional[dict], payload: dict) -> dict:
     return out
 
 
+# Steps whose fields feed the per-episode credit estimate.
+_ESTIMATE_STEPS = frozenset({2, 3, 5, 7})
+
+
+def _apply_step(series: Series, step: int, payload: dict) -> None:
+    """Mutate series for one wizard step. No commit, no estimate recompute."""
+    if step == 1:
+        if payload.get("name") is not None:
+            series.name = payload["name"]
+        if payload.get("contentType") is not None:
+            series.content_type = payload["contentType"]
+        if payload.get("customTopic") is not None:
+            series.custom_topic = payload["customTopic"]
+    elif step == 2:
+        series.script_preferences = _apply_json_update(series.script_preferences, payload)
+    elif step == 3:
+        series.voice_language = _apply_json_update(series.voice_language, payload)
+    elif step == 4:
+        # Convert UUIDs to str for JSON
+        p = dict(payload)
+        if p.get("libraryTrackId") is not None:
+            p["libraryTrackId"] = str(p["libraryTrackId"])
+        if p.get("customUploadAssetId") is not None:
+            p["customUploadAssetId"] = str(p["customUploadAssetId"])
+        series.music_settings = _apply_json_update(series.music_settings, p)
+    elif step == 5:
+        series.art_style = _apply_json_update(series.art_style, payload)
+    elif step == 6:
+        series.caption_style = _apply_json_update(series.caption_style, payload)
+    elif step == 7:
+        effects = payload.get("effects")
+        if effects is not None:
+            series.visual_effects = [e.model_dump() if hasattr(e, "model_dump") else e for e in effects]
+            series.premium_effect_count = count_premium_effects(series.visual_effects)
+    elif step == 8:
+        ids = payload.get("socialAccountIds")
+        if ids is not None:
+            series.connected_social_account_ids = [str(x) for x in ids]
+            series.auto_post_enabled = bool(series.connected_social_account_ids)
+    elif step == 9:
+        series.schedule = _apply_json_update(series.schedule, payload)
+    else:
+        raise ValueError(f"Unknown wizard step: {step}")
+
+
+def update_series_bulk(db: Session, series: Series, updates: dict[int, dict]) -> Series:
+    """Apply several wizard steps in one transaction.
+
+    Mutates all fields first, recomputes the credit estimate once (only when a
+    step that feeds it changed), then commits and refreshes once — instead of
+    one commit + refresh + estimate per step.
+    """
+    for step in sorted(updates):
+        _apply_step(series, step, updates[step] or {})
+    if _ESTIMATE_STEPS.intersection(updates):
+        series.estimated_credits_per_video = estimate_credits_per_episode(series)
+    db.commit()
+    db.refresh(series)
+    return series
+
+
 def update_step_1(
     db: Session,
     series: Series,
@@ -69,84 +131,41 @@ def update_step_1(
     content_type: Optional[str] = None,
     custom_topic: Optional[dict] = None,
 ) -> Series:
-    if name is not None:
-        series.name = name
-    if content_type is not None:
-        series.content_type = content_type
-    if custom_topic is not None:
-        series.custom_topic = custom_topic
-    db.commit()
-    db.refresh(series)
-    return series
+    return update_series_bulk(
+        db, series, {1: {"name": name, "contentType": content_type, "customTopic": custom_topic}}
+    )
 
 
 def update_step_2(db: Session, series: Series, payload: dict) -> Series:
-    series.script_preferences = _apply_json_update(series.script_preferences, payload)
-    series.estimated_credits_per_video = estimate_credits_per_episode(series)
-    db.commit()
-    db.refresh(series)
-    return series
+    return update_series_bulk(db, series, {2: payload})
 
 
 def update_step_3(db: Session, series: Series, payload: dict) -> Series:
-    series.voice_language = _apply_json_update(series.voice_language, payload)
-    series.estimated_credits_per_video = estimate_credits_per_episode(series)
-    db.commit()
-    db.refresh(series)
-    return series
+    return update_series_bulk(db, series, {3: payload})
 
 
 def update_step_4(db: Session, series: Series, payload: dict) -> Series:
-    # Convert UUIDs to str for JSON
-    p = dict(payload)
-    if p.get("libraryTrackId") is not None:
-        p["libraryTrackId"] = str(p["libraryTrackId"])
-    if p.get("customUploadAssetId") is not None:
-        p["customUploadAssetId"] = str(p["customUploadAssetId"])
-    series.music_settings = _apply_json_update(series.music_settings, p)
-    db.commit()
-    db.refresh(series)
-    return series
+    return update_series_bulk(db, series, {4: payload})
 
 
 def update_step_5(db: Session, series: Series, payload: dict) -> Series:
-    series.art_style = _apply_json_update(series.art_style, payload)
-    series.estimated_credits_per_video = estimate_credits_per_episode(series)
-    db.commit()
-    db.refresh(series)
-    return series
+    return update_series_bulk(db, series, {5: payload})
 
 
 def update_step_6(db: Session, series: Series, payload: dict) -> Series:
-    series.caption_style = _apply_json_update(series.caption_style, payload)
-    db.commit()
-    db.refresh(series)
-    return series
+    return update_series_bulk(db, series, {6: payload})
 
 
 def update_step_7(db: Session, series: Series, effects: Optional[list[dict]]) -> Series:
-    if effects is not None:
-        series.visual_effects = [e.model_dump() if hasattr(e, "model_dump") else e for e in effects]
-    series.estimated_credits_per_video = estimate_credits_per_episode(series)
-    db.commit()
-    db.refresh(series)
-    return series
+    return update_series_bulk(db, series, {7: {"effects": effects}})
 
 
 def update_step_8(db: Session, series: Series, social_account_ids: Optional[list[uuid.UUID]]) -> Series:
-    if social_account_ids is not None:
-        series.connected_social_account_ids = [str(x) for x in social_account_ids]
-        series.auto_post_enabled = bool(series.connected_social_account_ids)
-    db.commit()
-    db.refresh(series)
-    return series
+    return update_series_bulk(db, series, {8: {"socialAccountIds": social_account_ids}})
 
 
 def update_step_9(db: Session, series: Series, payload: dict) -> Series:
-    series.schedule = _apply_json_update(series.schedule, payload)
-    db.commit()
-    db.refresh(series)
-    return series
+    return update_series_bulk(db, series, {9: payload})
 
 
 def launch_series(
@@ -171,22 +190,29 @@ def launch_series(
     else:
         episode_count = 7
     slots = get_next_publish_slots(schedule, count=episode_count)
-    upcoming = []
-    for i, slot_utc in enumerate(slots, start=1):
-        ep = Episode(
+    # PKs are generated client-side, so the whole batch goes through one
+    # executemany INSERT instead of a flush per episode; upcoming is built
+    # from the in-memory objects rather than refreshed ORM instances.
+    created_episodes = [
+        Episode(
             id=uuid.uuid4(),
             series_id=series.id,
             sequence_number=i,
             scheduled_at=slot_utc,
             status="scheduled",
         )
-        db.add(ep)
-        upcoming.append({
+        for i, slot_utc in enumerate(slots, start=1)
+    ]
+    db.bulk_save_objects(created_episodes)
+    upcoming = [
+        {
             "id": str(ep.id),
             "sequenceNumber": ep.sequence_number,
             "scheduledAt": ep.scheduled_at.isoformat() if ep.scheduled_at else None,
             "status": ep.status,
-        })
+        }
+        for ep in created_episodes
+    ]
     series.status = "active"
     series.auto_post_enabled = bool(series.connected_social_account_ids)
     if schedule.get("active") is not None:
@@ -194,6 +220,25 @@ def launch_series(
     db.commit()
     db.refresh(series)
 
+    # Scheduled scripts can ride the OpenAI Batch API (half price, 24h SLA)
+    # when everything is far enough out for the async window to fit.
+    settings = get_settings()
+    if (
+        settings.use_openai_batch_api
+        and settings.use_scene_based_video
+        and not settings.use_reel_engine_story
+        and slots
+        and slots[0] > datetime.now(timezone.utc) + timedelta(hours=1)
+    ):
+        from app.services.llm_batch import submit_script_batch
+
+        submit_script_batch(db, series, created_episodes)
+        return series, upcoming, {
+            "perEpisode": credit_per,
+            "estimatedMonthly": credit_per * (episode_count if frequency == "daily" else max(episode_count, 12)),
+            "currentBalance": balance,
+        }
+
     # Queue script generation 6 hours before each scheduled_at
     from app.workers.tasks.script import generate_script
 
@@ -1,16 +1,88 @@
 """Exchange OAuth codes for tokens and fetch basic profile per platform."""
 
+import atexit
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Optional
 from uuid import UUID
 
 import httpx
+import orjson
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.core.token_encryption import encrypt_token
 from app.db.models.social_account import SocialAccount
-from app.core.oauth_state import get_oauth_state, set_oauth_state
+from app.core.oauth_state import (
+    cache_social_account_id,
+    get_cached_social_account_id,
+    pop_oauth_state,
+    set_oauth_state,
+)
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Shared pooled client for all OAuth calls.
+
+    Every callback makes two requests to the same host back to back (token
+    exchange + profile fetch); keep-alive saves the second TLS handshake, and
+    the pool keeps warm sockets to the handful of platform hosts under load.
+    """
+    client = httpx.Client(
+        timeout=15.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    )
+    atexit.register(client.close)
+    return client
+
+
+def _post_json(
+    url: str,
+    *,
+    data: Optional[dict[str, Any]] = None,
+    headers: Optional[dict[str, str]] = None,
+    timeout: float = 15.0,
+) -> dict[str, Any]:
+    """POST via the pooled client, raise on HTTP errors, return parsed JSON."""
+    resp = get_http_client().post(url, data=data, headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
+
+
+def _get_json(
+    url: str,
+    *,
+    params: Optional[dict[str, Any]] = None,
+    headers: Optional[dict[str, str]] = None,
+    timeout: float = 10.0,
+) -> dict[str, Any]:
+    """GET via the pooled client, raise on HTTP errors, return parsed JSON."""
+    resp = get_http_client().get(url, params=params, headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
+
+
+# Profile lookups for a given short-lived access token are idempotent, so a
+# small TTL cache spares platform API quota (YouTube especially) when the
+# callback flow retries after a partial failure. Keyed by token: unique per
+# user, so no cross-user leakage.
+_PROFILE_CACHE: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+_PROFILE_CACHE_TTL = 300.0
+_PROFILE_CACHE_MAX = 256
+
+
+def _cached_profile(kind: str, access_token: str, fetch) -> dict[str, Any]:
+    now = time.monotonic()
+    hit = _PROFILE_CACHE.get((kind, access_token))
+    if hit and now - hit[0] < _PROFILE_CACHE_TTL:
+        return hit[1]
+    value = fetch()
+    if len(_PROFILE_CACHE) >= _PROFILE_CACHE_MAX:
+        _PROFILE_CACHE.clear()  # tiny cache; wholesale reset beats LRU bookkeeping
+    _PROFILE_CACHE[(kind, access_token)] = (now, value)
+    return value
 
 
 def _redirect_uri(base_url: str, platform: str) -> str:
@@ -39,7 +111,7 @@ def _tiktok_exchange(
         raise ValueError(
             "Missing PKCE code_verifier for TikTok OAuth. Please try connecting again."
         )
-    resp = httpx.post(
+    data = _post_json(
         "https://open.tiktokapis.com/v2/oauth/token/",
         headers={"Content-Type": "application/x-www-form-urlencoded"},
         data={
@@ -50,10 +122,7 @@ def _tiktok_exchange(
             "redirect_uri": redirect_uri,
             "code_verifier": code_verifier,
         },
-        timeout=15.0,
     )
-    resp.raise_for_status()
-    data = resp.json()
     err = data.get("error")
     if isinstance(err, dict) and err.get("code") and err.get("code") != "ok":
         raise ValueError(err.get("message") or f"TikTok token error: {err.get('code')}")
@@ -63,16 +132,15 @@ def _tiktok_exchange(
 
 
 def _tiktok_user_info(access_token: str) -> dict[str, Any]:
-    resp = httpx.get(
+    return _cached_profile("tiktok", access_token, lambda: _fetch_tiktok_user_info(access_token))
+
+
+def _fetch_tiktok_user_info(access_token: str) -> dict[str, Any]:
+    d = _get_json(
         "https://open.tiktokapis.com/v2/user/info/",
-        headers={
-            "Authorization": f"Bearer {access_token}",
-        },
+        headers={"Authorization": f"Bearer {access_token}"},
         params={"fields": "open_id,union_id,avatar_url,display_name"},
-        timeout=10.0,
     )
-    resp.raise_for_status()
-    d = resp.json()
     err = d.get("error")
     if isinstance(err, dict) and err.get("code") and err.get("code") != "ok":
         raise ValueError(err.get("message") or f"TikTok user info error: {err.get('code')}")
@@ -93,7 +161,7 @@ def _instagram_exchange(
 ) -> dict[str, Any]:
     # Strip fragment if present (Instagram sometimes appends #_)
     code = code.split("#")[0].strip()
-    resp = httpx.post(
+    return _post_json(
         "https://api.instagram.com/oauth/access_token",
         data={
             "client_id": client_id,
@@ -102,10 +170,7 @@ def _instagram_exchange(
             "redirect_uri": redirect_uri,
             "code": code,
         },
-        timeout=15.0,
     )
-    resp.raise_for_status()
-    return resp.json()
 
 
 # --- YouTube (Google OAuth) ---
@@ -115,7 +180,7 @@ def _google_exchange(
     client_id: str,
     client_secret: str,
 ) -> dict[str, Any]:
-    resp = httpx.post(
+    return _post_json(
         "https://oauth2.googleapis.com/token",
         data={
             "client_id": client_id,
@@ -125,20 +190,18 @@ def _google_exchange(
             "redirect_uri": redirect_uri,
         },
         headers={"Content-Type": "application/x-www-form-urlencoded"},
-        timeout=15.0,
     )
-    resp.raise_for_status()
-    return resp.json()
 
 
 def _youtube_channel(access_token: str) -> dict[str, Any]:
-    resp = httpx.get(
+    return _cached_profile("youtube", access_token, lambda: _fetch_youtube_channel(access_token))
+
+
+def _fetch_youtube_channel(access_token: str) -> dict[str, Any]:
+    data = _get_json(
         "https://www.googleapis.com/youtube/v3/channels?part=snippet&mine=true",
         headers={"Authorization": f"Bearer {access_token}"},
-        timeout=10.0,
     )
-    resp.raise_for_status()
-    data = resp.json()
     items = data.get("items") or []
     if not items:
         return {"platform_user_id": "", "display_name": "YouTube", "avatar_url": None}
@@ -157,7 +220,7 @@ def _facebook_exchange(
     app_id: str,
     app_secret: str,
 ) -> dict[str, Any]:
-    resp = httpx.get(
+    return _get_json(
         "https://graph.facebook.com/v21.0/oauth/access_token",
         params={
             "client_id": app_id,
@@ -167,18 +230,17 @@ def _facebook_exchange(
         },
         timeout=15.0,
     )
-    resp.raise_for_status()
-    return resp.json()
 
 
 def _facebook_me(access_token: str) -> dict[str, Any]:
-    resp = httpx.get(
+    return _cached_profile("facebook", access_token, lambda: _fetch_facebook_me(access_token))
+
+
+def _fetch_facebook_me(access_token: str) -> dict[str, Any]:
+    d = _get_json(
         "https://graph.facebook.com/v21.0/me",
         params={"fields": "id,name", "access_token": access_token},
-        timeout=10.0,
     )
-    resp.raise_for_status()
-    d = resp.json()
     return {
         "platform_user_id": d.get("id", ""),
         "display_name": d.get("name", "Facebook"),
@@ -207,7 +269,7 @@ def handle_oauth_callback(
     if error_from_platform or not code:
         return None, error_from_platform or "Missing authorization code"
 
-    data = get_oauth_state(state)
+    data = pop_oauth_state(state)
     if not data:
         return None, "Invalid or expired state. Please try connecting again."
     workspace_id = data.get("workspace_id")
@@ -287,16 +349,25 @@ def handle_oauth_callback(
     if not access_token:
         return None, "No access token in response"
 
-    # Find existing account for this workspace + platform (by platform user id if we have it)
+    # Find existing account for this workspace + platform. Reconnects are
+    # common, so try the cached account id first: a primary-key get beats
+    # the filtered query. Verify ownership in case the cache is stale.
     workspace_uuid = UUID(workspace_id)
-    existing = (
-        db.query(SocialAccount)
-        .filter(
-            SocialAccount.workspace_id == workspace_uuid,
-            SocialAccount.platform == platform,
+    existing = None
+    cached_id = get_cached_social_account_id(workspace_id, platform)
+    if cached_id:
+        existing = db.get(SocialAccount, UUID(cached_id))
+        if existing and (existing.workspace_id != workspace_uuid or existing.platform != platform):
+            existing = None
+    if existing is None:
+        existing = (
+            db.query(SocialAccount)
+            .filter(
+                SocialAccount.workspace_id == workspace_uuid,
+                SocialAccount.platform == platform,
+            )
+            .first()
         )
-        .first()
-    )
     if existing:
         # Update tokens and profile
         existing.access_token = encrypt_token(access_token)
@@ -309,6 +380,7 @@ def handle_oauth_callback(
         existing.status = "connected"
         db.commit()
         db.refresh(existing)
+        cache_social_account_id(workspace_id, platform, str(existing.id))
         return existing, None
 
     account = SocialAccount(
@@ -326,4 +398,5 @@ def handle_oauth_callback(
     db.add(account)
     db.commit()
     db.refresh(account)
+    cache_social_account_id(workspace_id, platform, str(account.id))
     return account, None
@@ -2,31 +2,58 @@
 
 import io
 import uuid
+from functools import lru_cache
 from typing import BinaryIO, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 
 from app.config import get_settings
 
+# Shared transfer config: small objects (scene MP3s/PNGs) stay single-part,
+# large ones (rendered videos) get parallel multipart uploads.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
 
-def _client():
-    settings = get_settings()
+
+@lru_cache(maxsize=4)
+def _client_for(endpoint_url: Optional[str], region: str):
     kwargs = {
-        "region_name": settings.s3_region,
-        "aws_access_key_id": settings.aws_access_key_id or None,
-        "aws_secret_access_key": settings.aws_secret_access_key or None,
-        "config": Config(signature_version="s3v4"),
+        "region_name": region,
+        "aws_access_key_id": get_settings().aws_access_key_id or None,
+        "aws_secret_access_key": get_settings().aws_secret_access_key or None,
+        # Pool sized for chord-parallel scene upload bursts (default is 10,
+        # which exhausts under multipart + per-scene concurrency); keep-alive
+        # holds sockets open between bursts and adaptive retries back off
+        # with S3's own throttle feedback.
+        "config": Config(
+            signature_version="s3v4",
+            max_pool_connections=64,
+            tcp_keepalive=True,
+            retries={"max_attempts": 5, "mode": "adaptive"},
+        ),
     }
-    if settings.s3_endpoint_url:
-        kwargs["endpoint_url"] = settings.s3_endpoint_url
+    if endpoint_url:
+        kwargs["endpoint_url"] = endpoint_url
     else:
         # Use regional endpoint so presigned URLs don't trigger 307 redirect;
         # following redirect changes Host and invalidates the signature (403).
-        kwargs["endpoint_url"] = f"https://s3.{settings.s3_region}.amazonaws.com"
+        kwargs["endpoint_url"] = f"https://s3.{region}.amazonaws.com"
     return boto3.client("s3", **kwargs)
 
 
+def _client():
+    # Cached per (endpoint, region): building a boto3 client re-loads service
+    # models and a fresh urllib3 pool each time, which is far slower than any
+    # individual presign, and reuse keeps S3 connections warm across uploads.
+    settings = get_settings()
+    return _client_for(settings.s3_endpoint_url, settings.s3_region)
+
+
 def upload_file(
     key: str,
     body: BinaryIO,
@@ -45,6 +72,7 @@ def upload_file(
         bucket,
         key,
         ExtraArgs={"ContentType": content_type},
+        Config=_TRANSFER_CONFIG,
     )
     if settings.s3_endpoint_url:
         return f"{settings.s3_endpoint_url}/{bucket}/{key}"
@@ -58,10 +86,36 @@ def upload_bytes(
     bucket: Optional[str] = None,
 ) -> str:
     """Upload bytes to S3; return URL."""
-    import io
     return upload_file(key, io.BytesIO(data), content_type, bucket=bucket)
 
 
+def copy_object(
+    src_key: str,
+    dest_key: str,
+    content_type: str,
+    bucket: Optional[str] = None,
+) -> str:
+    """Server-side copy within the bucket; return the destination URL."""
+    settings = get_settings()
+    bucket = bucket or settings.s3_bucket
+    _client().copy_object(
+        Bucket=bucket,
+        Key=dest_key,
+        CopySource={"Bucket": bucket, "Key": src_key},
+        ContentType=content_type,
+        MetadataDirective="REPLACE",
+    )
+    if settings.s3_endpoint_url:
+        return f"{settings.s3_endpoint_url}/{bucket}/{dest_key}"
+    return f"https://{bucket}.s3.{settings.s3_region}.amazonaws.com/{dest_key}"
+
+
+def delete_object(key: str, bucket: Optional[str] = None) -> None:
+    """Delete one object (e.g. a scratch upload)."""
+    settings = get_settings()
+    _client().delete_object(Bucket=bucket or settings.s3_bucket, Key=key)
+
+
 def presigned_url(
     key: str,
     expiration: int = 3600,
@@ -78,6 +132,14 @@ def presigned_url(
     )
 
 
+@lru_cache(maxsize=4)
+def _url_prefix(endpoint_url: Optional[str], bucket: str, region: str) -> str:
+    # Custom endpoint (e.g. MinIO) is path-style: http://host/bucket/key
+    if endpoint_url:
+        return f"{endpoint_url.rstrip('/')}/{bucket}/"
+    return f"https://{bucket}.s3.{region}.amazonaws.com/"
+
+
 def get_download_url(url: str, expiration: int = 3600) -> str:
     """
     Resolve a stored object URL to a URL that can be GET'd (e.g. presigned for private S3).
@@ -85,16 +147,9 @@ def get_download_url(url: str, expiration: int = 3600) -> str:
     to the frontend (video preview, music playback, asset list). Leaves non-S3 URLs unchanged.
     """
     settings = get_settings()
-    if not settings.aws_access_key_id or not settings.aws_secret_access_key:
-        return url
-    if settings.s3_endpoint_url:
-        # Custom endpoint (e.g. MinIO): path-style like http://host/bucket/key
-        base = f"{settings.s3_endpoint_url.rstrip('/')}/{settings.s3_bucket}/"
-        if url.startswith(base):
-            key = url[len(base):]
-            return presigned_url(key, expiration=expiration)
+    if not settings.s3_configured:
         return url
-    prefix = f"https://{settings.s3_bucket}.s3.{settings.s3_region}.amazonaws.com/"
+    prefix = _url_prefix(settings.s3_endpoint_url, settings.s3_bucket, settings.s3_region)
     if url.startswith(prefix):
         key = url[len(prefix):]
         return presigned_url(key, expiration=expiration)
@@ -3,16 +3,56 @@
 API keys (ELEVENLABS_API_KEY, etc.) must be set in env and never committed or shared.
 """
 
+import hashlib
 import logging
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, BinaryIO, Optional
 
 import httpx
 
 from app.config import Settings, get_settings
+from app.core.redis_client import get_redis
 from app.services.llm_service import get_openai_client
 
 logger = logging.getLogger(__name__)
 
+# Read-through Redis cache for synthesized audio: identical text+voice
+# requests (re-renders, retries) skip the paid TTS call. Bytes are
+# content-addressed by the full request fingerprint, so a 24h TTL is safe.
+_TTS_CACHE_TTL = 86400
+
+
+def _tts_cache_key(
+    provider: str,
+    voice_id: str,
+    model: str,
+    text: str,
+    emotion_tag: Optional[str],
+    stability: Optional[float],
+) -> str:
+    digest = hashlib.sha256(
+        f"{model}|{text}|{emotion_tag or ''}|{stability if stability is not None else ''}".encode("utf-8")
+    ).hexdigest()
+    return f"tts:{provider}:{voice_id}:{digest}"
+
+
+def _tts_cache_get(key: str) -> Optional[bytes]:
+    try:
+        # Binary client: audio bytes must not be utf-8 decoded.
+        value = get_redis().get(key)
+    except Exception:
+        return None  # cache is best-effort; Redis being down never blocks TTS
+    if value:
+        logger.info("TTS cache hit (%d bytes)", len(value))
+    return value or None
+
+
+def _tts_cache_set(key: str, audio: bytes) -> None:
+    try:
+        get_redis().setex(key, _TTS_CACHE_TTL, audio)
+    except Exception:
+        pass
+
 # OpenAI TTS voice IDs and display info
 OPENAI_VOICES = [
     {"id": "alloy", "name": "Alloy", "languageCode": "en-US", "gender": "neutral", "style": "neutral"},
@@ -24,15 +64,22 @@ OPENAI_VOICES = [
 ]
 
 
+@lru_cache(maxsize=8)
+def _voices_for(language_code: Optional[str]) -> tuple[dict, ...]:
+    voices = OPENAI_VOICES
+    if language_code:
+        voices = [v for v in voices if v["languageCode"] == language_code]
+    return tuple(voices)
+
+
 def list_voices(language_code: Optional[str] = None) -> list[dict]:
     """Return available TTS voices (OpenAI). Optionally filter by language."""
     settings = get_settings()
     if not settings.openai_api_key:
         return []
-    voices = list(OPENAI_VOICES)
-    if language_code:
-        voices = [v for v in voices if v["languageCode"] == language_code]
-    return voices
+    # Filtering is pure over a static table; cache per language and hand out
+    # copies so callers can't mutate the cached entries.
+    return [dict(v) for v in _voices_for(language_code)]
 
 
 def get_elevenlabs_model_id_for_request(
@@ -67,6 +114,27 @@ def _synthesize_openai(
     return resp.content
 
 
+def _stream_openai(
+    text: str,
+    voice_id: str,
+    model: Optional[str],
+    settings: Settings,
+    dest: BinaryIO,
+) -> None:
+    """Stream OpenAI TTS audio into ``dest`` without buffering the full payload."""
+    if not settings.openai_api_key:
+        raise ValueError("OpenAI API key not set; cannot use OpenAI TTS")
+    client = get_openai_client()
+    model = model or settings.openai_tts_model
+    with client.audio.speech.with_streaming_response.create(
+        model=model,
+        voice=voice_id,
+        input=text[:4096],
+    ) as resp:
+        for chunk in resp.iter_bytes():
+            dest.write(chunk)
+
+
 def _synthesize_elevenlabs(
     text: str,
     voice_id: str,
@@ -148,6 +216,7 @@ def synthesize(
     *,
     emotion_tag: Optional[str] = None,
     stability: Optional[float] = None,
+    dest: Optional[BinaryIO] = None,
 ) -> bytes:
     """
     Synthesize speech from text. Returns MP3 bytes.
@@ -158,18 +227,54 @@ def synthesize(
 
     Optional (ElevenLabs): emotion_tag (e.g. "whispers", "[sad]") for Eleven v3 audio tags;
     stability (0-1, lower=more expressive). Narrator vs character: use different voice_id per call.
+
+    When ``dest`` is given, audio is written into it instead of returned (an
+    empty bytes is returned), streamed chunk-by-chunk on the OpenAI path so
+    the full payload is never held in memory. Callers that need duration
+    probing or the ElevenLabs fallback should use the bytes form.
     """
     settings = get_settings()
     provider = getattr(settings, "tts_provider", "openai")
+    # Key on the model actually used so a model switch never serves the old
+    # model's audio for the cache TTL.
+    if provider == "elevenlabs":
+        resolved_model = get_elevenlabs_model_id_for_request(text, emotion_tag, settings)
+    else:
+        resolved_model = model or settings.openai_tts_model
+    cache_key = _tts_cache_key(provider, voice_id, resolved_model, text, emotion_tag, stability)
+    cached = _tts_cache_get(cache_key)
+    if dest is not None:
+        if cached is not None:
+            dest.write(cached)
+        elif provider == "elevenlabs":
+            # ElevenLabs fallback needs a replayable body; buffer that path.
+            dest.write(
+                synthesize(
+                    text,
+                    voice_id=voice_id,
+                    model=model,
+                    emotion_tag=emotion_tag,
+                    stability=stability,
+                )
+            )
+        else:
+            # Streamed misses skip the write-back; hot scene audio goes
+            # through the bytes path, which still populates the cache.
+            _stream_openai(text, voice_id=voice_id, model=model, settings=settings, dest=dest)
+        return b""
+    if cached is not None:
+        return cached
     if provider == "elevenlabs":
         try:
-            return _synthesize_elevenlabs(
+            audio = _synthesize_elevenlabs(
                 text,
                 voice_id=voice_id,
                 settings=settings,
                 emotion_tag=emotion_tag,
                 stability=stability,
             )
+            _tts_cache_set(cache_key, audio)
+            return audio
         except (httpx.RequestError, httpx.HTTPStatusError) as e:
             status = getattr(e, "response", None)
             status_code = status.status_code if status is not None else None
@@ -184,6 +289,10 @@ def synthesize(
                     "(no spaces, use current key after any regeneration)."
                 )
             # Use OpenAI voice_id (alloy, nova, etc.); series typically sends these.
+            # Fallback audio is deliberately not cached under the ElevenLabs
+            # key so recovered outages don't serve the wrong provider's voice.
             openai_voice = voice_id if voice_id in {v["id"] for v in OPENAI_VOICES} else "alloy"
             return _synthesize_openai(text, voice_id=openai_voice, model=model, settings=settings)
-    return _synthesize_openai(text, voice_id=voice_id, model=model, settings=settings)
+    audio = _synthesize_openai(text, voice_id=voice_id, model=model, settings=settings)
+    _tts_cache_set(cache_key, audio)
+    return audio
@@ -1,6 +1,8 @@
 """Celery app configuration."""
 
 from celery import Celery
+from celery.signals import worker_process_init
+
 from app.config import get_settings
 
 settings = get_settings()
@@ -35,5 +37,39 @@ celery_app.conf.update(
             "task": "app.workers.tasks.schedule.publish_due_episodes",
             "schedule": 300.0,
         },
+        "poll-script-batches": {
+            "task": "app.workers.tasks.script.poll_script_batches",
+            "schedule": 300.0,
+        },
     },
 )
+
+
+@worker_process_init.connect
+def _prewarm_worker(**_kwargs):
+    """Warm per-process caches at worker boot instead of on the first task.
+
+    A fresh (or autoscaled) worker otherwise pays settings parsing, S3/HTTP
+    client construction, PBKDF2 key derivation, and the first DB connection
+    on whatever task happens to arrive first. Best-effort: a cold cache is
+    never worth failing worker startup over.
+    """
+    try:
+        from sqlalchemy import text
+
+        from app.core.token_encryption import warm_token_encryption
+        from app.db.base import SessionLocal
+        from app.services.social_oauth_service import get_http_client
+        from app.services.storage_service import _client
+
+        get_settings()
+        warm_token_encryption()
+        get_http_client()
+        _client()
+        db = SessionLocal()
+        try:
+            db.execute(text("SELECT 1"))  # opens (and pools) one DB connection
+        finally:
+            db.close()
+    except Exception:
+        pass
@@ -26,15 +26,10 @@ logger = logging.getLogger(__name__)
 
 
 def _voice_id_from_series(voice_language: dict | None) -> str:
-    if not voice_language:
-        return "alloy"
-    gender = (voice_language.get("gender") or "").lower()
-    style = (voice_language.get("style") or "").lower()
-    if "female" in gender:
-        return "nova" if "warm" in style else "shimmer"
-    if "male" in gender:
-        return "onyx" if "deep" in style else "echo"
-    return "alloy"
+    # Same mapping as media.generate_media; delegate to the shared table there.
+    from app.workers.tasks.media import _voice_id_from_series as _impl
+
+    return _impl(voice_language)
 
 
 def _convert_mp3_to_normalized_wav16_mono(
@@ -150,7 +145,7 @@ def generate_avatar_video(self, episode_id: str):
             # Fail fast if avatar mode is not enabled via feature flag.
             raise ValueError("Avatar mode is disabled (ENABLE_AVATAR_MODE=false).")
 
-        episode = db.query(Episode).filter(Episode.id == uuid.UUID(episode_id)).first()
+        episode = db.get(Episode, uuid.UUID(episode_id))
         if not episode:
             raise ValueError(f"Episode {episode_id} not found")
         series = db.query(Series).filter(Series.id == episode.series_id).first()
@@ -178,7 +173,7 @@ def generate_avatar_video(self, episode_id: str):
 
         # Upload WAV to S3 (or placeholder URL when S3 is disabled).
         key_audio = f"workspaces/{workspace_id}/episodes/{episode_id}/avatar_voice.wav"
-        if settings.aws_access_key_id and settings.aws_secret_access_key:
+        if settings.s3_configured:
             audio_canonical_url = upload_bytes(key_audio, wav_bytes, "audio/wav")
             audio_url = get_download_url(audio_canonical_url, expiration=3600)
         else:
@@ -222,7 +217,7 @@ def generate_avatar_video(self, episode_id: str):
             tmp_path.write_bytes(resp.content)
 
             key_video = f"workspaces/{workspace_id}/episodes/{episode_id}/avatar_talking.mp4"
-            if settings.aws_access_key_id and settings.aws_secret_access_key:
+            if settings.s3_configured:
                 with open(tmp_path, "rb") as f:
                     final_url = upload_file(key_video, f, "video/mp4")
             else:
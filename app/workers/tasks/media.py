@@ -1,36 +1,62 @@
 from __future__ import annotations
 
+import io
+import socket
 import subprocess
 import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from celery import chord
+from mutagen.mp3 import MP3
 from openai import OpenAIError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.config import get_settings
+from app.core.redis_client import get_redis
 from app.db.base import SessionLocal
 from app.db.models.asset import Asset
 from app.db.models.episode import Episode, Script
 from app.db.models.series import Series
-from app.services.cache import get_cached_tts_asset_id, set_cached_tts_asset_id
+from app.services.cache import get_cached_tts_asset_id, tts_cache_metadata
 from app.services.image_service import generate_scene_image, generate_video_image
 from app.services.storage_service import upload_bytes
 from app.services.tts_service import synthesize as tts_synthesize
 from app.workers.celery_app import celery_app
 
 
+# Voice choice as data rather than a branch tree: (gender, style) -> voice.
+# "" means "no recognized style modifier" for that gender.
+_VOICE_TABLE = {
+    ("female", "warm"): "nova",
+    ("female", ""): "shimmer",
+    ("male", "deep"): "onyx",
+    ("male", ""): "echo",
+}
+
+
+@lru_cache(maxsize=64)
+def _voice_for_profile(gender: str, style: str) -> str:
+    # "female" contains "male", so test for it first.
+    if "female" in gender:
+        key = ("female", "warm" if "warm" in style else "")
+    elif "male" in gender:
+        key = ("male", "deep" if "deep" in style else "")
+    else:
+        return "alloy"
+    return _VOICE_TABLE.get(key, "alloy")
+
+
 def _voice_id_from_series(voice_language: dict | None) -> str:
     """OpenAI-style voice name from series (alloy, nova, onyx, etc.)."""
     if not voice_language:
         return "alloy"
-    gender = (voice_language.get("gender") or "").lower()
-    style = (voice_language.get("style") or "").lower()
-    if "female" in gender:
-        return "nova" if "warm" in style else "shimmer"
-    if "male" in gender:
-        return "onyx" if "deep" in style else "echo"
-    return "alloy"
+    return _voice_for_profile(
+        (voice_language.get("gender") or "").lower(),
+        (voice_language.get("style") or "").lower(),
+    )
 
 
 def _voice_id_for_scene(
@@ -69,7 +95,15 @@ def _voice_id_for_scene(
     return _voice_id_from_series(voice_language)
 
 
-def _probe_duration_seconds(audio_bytes: bytes) -> float:
+def _probe_duration_seconds(audio_bytes: bytes, default: float = 5.0) -> float:
+    # Parse MP3 frame headers in-process; no temp file, no fork. ffprobe is
+    # kept only as a fallback for payloads mutagen can't read.
+    try:
+        length = MP3(io.BytesIO(audio_bytes)).info.length
+        if length and length > 0:
+            return float(length)
+    except Exception:
+        pass
     try:
         with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
             f.write(audio_bytes)
@@ -93,7 +127,66 @@ def _probe_duration_seconds(audio_bytes: bytes) -> float:
             Path(path).unlink(missing_ok=True)
     except Exception:
         pass
-    return 5.0
+    return default
+
+
+def _tts_scene_worker(
+    settings,
+    workspace_id: uuid.UUID,
+    episode_id: str,
+    idx: int,
+    text: str,
+    voice_id: str,
+    emotion_tag: str | None,
+) -> tuple[float, str]:
+    """Synthesize, probe, and upload one scene's voice track (thread-pool worker)."""
+    audio_bytes = tts_synthesize(text, voice_id=voice_id, emotion_tag=emotion_tag or None)
+    duration = _probe_duration_seconds(audio_bytes)
+    key_voice = f"workspaces/{workspace_id}/episodes/{episode_id}/scene_{idx}_voice.mp3"
+    if settings.s3_configured:
+        url_voice = upload_bytes(key_voice, audio_bytes, "audio/mpeg")
+    else:
+        url_voice = f"https://storage.example.com/{key_voice}"
+    return duration, url_voice
+
+
+def _image_scene_worker(
+    settings,
+    workspace_id: uuid.UUID,
+    episode_id: str,
+    idx: int,
+    vis: str,
+) -> str | None:
+    """Generate and upload one scene's cover image (thread-pool worker)."""
+    image_bytes = generate_scene_image(vis, scene_index=idx)
+    if image_bytes and settings.s3_configured:
+        key_image = f"workspaces/{workspace_id}/episodes/{episode_id}/scene_{idx}.png"
+        return upload_bytes(key_image, image_bytes, "image/png")
+    return None
+
+
+# acks_late + retries mean the same generate_media message can be delivered
+# twice; an NX lock makes the duplicate a cheap no-op instead of a second
+# full TTS/image/S3 spend. TTL covers the longest expected generation.
+_MEDIA_LOCK_TTL = 600
+
+
+def _acquire_media_lock(episode_id: str) -> bool:
+    try:
+        return bool(
+            get_redis().set(
+                f"gen_media:{episode_id}", socket.gethostname(), nx=True, ex=_MEDIA_LOCK_TTL
+            )
+        )
+    except Exception:
+        return True  # lock is best-effort; Redis down falls back to the manifest check
+
+
+def _release_media_lock(episode_id: str) -> None:
+    try:
+        get_redis().delete(f"gen_media:{episode_id}")
+    except Exception:
+        pass
 
 
 def _resolve_music_asset(db: Session, series: Series, workspace_id: uuid.UUID) -> uuid.UUID | None:
@@ -116,19 +209,42 @@ def _resolve_music_asset(db: Session, series: Series, workspace_id: uuid.UUID) -
 
 @celery_app.task(bind=True, autoretry_for=(ConnectionError, TimeoutError), retry_backoff=True, max_retries=5)
 def generate_media(self, episode_id: str):
+    if not _acquire_media_lock(episode_id):
+        # Another worker is already generating this episode.
+        return {"episode_id": episode_id, "status": "locked"}
+    hold_lock = False
     db: Session = SessionLocal()
     episode = None
     try:
-        episode = db.query(Episode).filter(Episode.id == uuid.UUID(episode_id)).first()
+        # One round-trip for episode + series + script instead of three.
+        episode = (
+            db.query(Episode)
+            .options(joinedload(Episode.series), joinedload(Episode.script))
+            .filter(Episode.id == uuid.UUID(episode_id))
+            .one_or_none()
+        )
         if not episode:
             raise ValueError(f"Episode {episode_id} not found")
-        series = db.query(Series).filter(Series.id == episode.series_id).first()
+        series = episode.series
         if not series:
             raise ValueError(f"Series not found")
-        script = db.query(Script).filter(Script.id == episode.script_id).first() if episode.script_id else None
+        script = episode.script
         if not script or not script.text:
             raise ValueError("Episode has no script text")
 
+        # A prior (crashed-after-commit) run already produced the manifest;
+        # hand it back instead of regenerating. Re-dispatch rendering too:
+        # the crash window this guard covers is exactly "manifest committed,
+        # render_video.delay never sent", and a duplicate render request is
+        # idempotent while a stuck episode is not.
+        manifest = episode.error.get("media") if isinstance(episode.error, dict) else None
+        if manifest and episode.status != "failed":
+            if not episode.video_asset_id:
+                from app.workers.tasks.render import render_video
+
+                render_video.delay(episode_id)
+            return {"episode_id": episode_id, "status": "already_generated", "media": manifest}
+
         settings = get_settings()
         workspace_id = series.workspace_id
         meta = {"episode_id": episode_id}
@@ -143,112 +259,26 @@ def generate_media(self, episode_id: str):
         )
 
         if use_scenes:
-            # Scene-based pipeline: N TTS + N images per scene
-            scene_refs = []
+            # Scene-based pipeline: one generate_scene subtask per scene,
+            # joined by a chord into finalize_media. Scenes run in parallel
+            # across the whole Celery pool (not just this worker's threads),
+            # and rendering starts as soon as the last scene lands. Validate
+            # up front so structurally broken scripts fail here, not mid-fanout.
             for idx, scene in enumerate(script.scenes):
-                text = (scene.get("text") or "").strip()
-                # Never fall back to narration text for image prompts: it can cause the image model
-                # to "render" on-image captions (gibberish/watermarks). Use a safe generic visual
-                # prompt if the LLM didn't provide a visual_description.
-                vis = (scene.get("visual_description") or "").strip()
-                if not vis:
-                    vis = "soft abstract atmospheric background, gentle gradients, cinematic lighting, no text"
-                if not text:
+                if not (scene.get("text") or "").strip():
                     raise ValueError(f"Scene {idx + 1} has no text")
-                voice_id = _voice_id_for_scene(
-                    series.voice_language, scene, default_elevenlabs
-                )
-                scene_type = (scene.get("scene_type") or "narration").lower()
-                emotion_tag = (scene.get("emotion") or "").strip() if scene_type == "dialogue" else None
-                cached_asset_id = get_cached_tts_asset_id(db, workspace_id, text, voice_id)
-                if cached_asset_id:
-                    existing = db.query(Asset).filter(
-                        Asset.id == cached_asset_id,
-                        Asset.workspace_id == workspace_id,
-                        Asset.type == "audio",
-                    ).first()
-                else:
-                    existing = None
-                if existing:
-                    voice_asset = existing
-                    duration = existing.duration_seconds if existing.duration_seconds is not None else 5.0
-                else:
-                    audio_bytes = tts_synthesize(
-                        text,
-                        voice_id=voice_id,
-                        emotion_tag=emotion_tag or None,
-                    )
-                    duration = _probe_duration_seconds(audio_bytes)
-                    key_voice = f"workspaces/{workspace_id}/episodes/{episode_id}/scene_{idx}_voice.mp3"
-                    if settings.aws_access_key_id and settings.aws_secret_access_key:
-                        url_voice = upload_bytes(key_voice, audio_bytes, "audio/mpeg")
-                    else:
-                        url_voice = f"https://storage.example.com/{key_voice}"
-                    voice_asset = Asset(
-                        id=uuid.uuid4(),
-                        workspace_id=workspace_id,
-                        type="audio",
-                        source="generated",
-                        url=url_voice,
-                        format="audio/mpeg",
-                        duration_seconds=duration,
-                        metadata_={**meta, "role": "scene_voice", "scene_index": idx},
-                    )
-                    db.add(voice_asset)
-                    db.flush()
-                    set_cached_tts_asset_id(db, workspace_id, voice_asset.id, text, voice_id)
-                image_asset_id = None
-                image_bytes = generate_scene_image(vis, scene_index=idx)
-                if image_bytes and settings.aws_access_key_id and settings.aws_secret_access_key:
-                    key_image = f"workspaces/{workspace_id}/episodes/{episode_id}/scene_{idx}.png"
-                    url_image = upload_bytes(key_image, image_bytes, "image/png")
-                    img_asset = Asset(
-                        id=uuid.uuid4(),
-                        workspace_id=workspace_id,
-                        type="image",
-                        source="generated",
-                        url=url_image,
-                        format="image/png",
-                        duration_seconds=None,
-                        metadata_={**meta, "role": "scene_cover", "scene_index": idx},
-                    )
-                    db.add(img_asset)
-                    db.flush()
-                    image_asset_id = str(img_asset.id)
-                scene_refs.append({
-                    "image_asset_id": image_asset_id,
-                    "voice_asset_id": str(voice_asset.id),
-                    "duration_seconds": duration,
-                })
-            caption_asset = Asset(
-                id=uuid.uuid4(),
-                workspace_id=workspace_id,
-                type="caption_file",
-                source="generated",
-                url="",
-                format="srt",
-                duration_seconds=None,
-                metadata_={**meta, "text": script.text[:2000]},
-            )
-            db.add(caption_asset)
-            db.flush()
-            music_asset_id = _resolve_music_asset(db, series, workspace_id)
-            episode.error = {
-                "media": {
-                    "scenes": scene_refs,
-                    "caption_asset_id": str(caption_asset.id),
-                    "music_asset_id": str(music_asset_id) if music_asset_id else None,
-                }
-            }
             episode.status = "generating"
             db.commit()
-            from app.workers.tasks.render import render_video
-            render_video.delay(episode_id)
+            chord(
+                [generate_scene.s(episode_id, idx) for idx in range(len(script.scenes))]
+            )(finalize_media.s(episode_id))
+            # Keep the lock until TTL: the chord is still running, and a
+            # redelivered message in that window must not re-dispatch it.
+            hold_lock = True
             return {
                 "episode_id": episode_id,
-                "status": "ok",
-                "scene_count": len(scene_refs),
-                "caption_asset_id": str(caption_asset.id),
+                "status": "dispatched",
+                "scene_count": len(script.scenes),
             }
 
         # Legacy: single voice + single image
@@ -264,12 +294,16 @@ def generate_media(self, episode_id: str):
             ).first()
         else:
             existing = None
+        # Asset ids are client-generated, so nothing below needs a flush to
+        # learn them; all rows go to the DB in one batch at commit instead
+        # of one synchronous INSERT round-trip per asset.
+        new_assets: list[Asset] = []
         if existing:
             voice_asset = existing
         else:
             audio_bytes = tts_synthesize(script.text, voice_id=voice_id)
             key_voice = f"workspaces/{workspace_id}/episodes/{episode_id}/voice.mp3"
-            if settings.aws_access_key_id and settings.aws_secret_access_key:
+            if settings.s3_configured:
                 url_voice = upload_bytes(key_voice, audio_bytes, "audio/mpeg")
             else:
                 url_voice = f"https://storage.example.com/{key_voice}"
@@ -281,11 +315,10 @@ def generate_media(self, episode_id: str):
                 url=url_voice,
                 format="audio/mpeg",
                 duration_seconds=None,
-                metadata_={**meta, "role": "voice"},
+                # Cache metadata set at insert time; no post-hoc UPDATE.
+                metadata_={**meta, "role": "voice", **tts_cache_metadata(script.text, voice_id)},
             )
-            db.add(voice_asset)
-            db.flush()
-            set_cached_tts_asset_id(db, workspace_id, voice_asset.id, script.text, voice_id)
+            new_assets.append(voice_asset)
         music_asset_id = _resolve_music_asset(db, series, workspace_id)
         caption_asset = Asset(
             id=uuid.uuid4(),
@@ -297,11 +330,10 @@ def generate_media(self, episode_id: str):
             duration_seconds=None,
             metadata_={**meta, "text": script.text[:2000]},
         )
-        db.add(caption_asset)
-        db.flush()
+        new_assets.append(caption_asset)
         image_asset_id = None
         image_bytes = generate_video_image(script.text)
-        if image_bytes and settings.aws_access_key_id and settings.aws_secret_access_key:
+        if image_bytes and settings.s3_configured:
             key_image = f"workspaces/{workspace_id}/episodes/{episode_id}/cover.png"
             url_image = upload_bytes(key_image, image_bytes, "image/png")
             image_asset = Asset(
@@ -314,9 +346,9 @@ def generate_media(self, episode_id: str):
                 duration_seconds=None,
                 metadata_={**meta, "role": "video_cover"},
             )
-            db.add(image_asset)
-            db.flush()
+            new_assets.append(image_asset)
             image_asset_id = str(image_asset.id)
+        db.add_all(new_assets)
         episode.error = {
             "media": {
                 "voice_asset_id": str(voice_asset.id),
@@ -354,5 +386,196 @@ def generate_media(self, episode_id: str):
             episode.error = {"step": "media_generation", "message": str(e)}
             db.commit()
         raise
+    finally:
+        if not hold_lock:
+            _release_media_lock(episode_id)
+        db.close()
+
+
+@celery_app.task(bind=True, autoretry_for=(ConnectionError, TimeoutError), retry_backoff=True, max_retries=5)
+def generate_scene(self, episode_id: str, scene_idx: int) -> dict:
+    """Generate one scene's voice + image and return its scene_ref.
+
+    Runs as a chord header task so scenes spread across the worker pool.
+    Asset rows are returned (JSON-safe) for finalize_media to bulk-insert,
+    keeping all episode DB writes in one place.
+    """
+    db: Session = SessionLocal()
+    episode = None
+    try:
+        episode = (
+            db.query(Episode)
+            .options(joinedload(Episode.series), joinedload(Episode.script))
+            .filter(Episode.id == uuid.UUID(episode_id))
+            .one_or_none()
+        )
+        if not episode:
+            raise ValueError(f"Episode {episode_id} not found")
+        series = episode.series
+        script = episode.script
+        if not script or not script.scenes or scene_idx >= len(script.scenes):
+            raise ValueError(f"Episode {episode_id} has no scene {scene_idx}")
+        scene = script.scenes[scene_idx]
+
+        settings = get_settings()
+        workspace_id = series.workspace_id
+        meta = {"episode_id": episode_id}
+        default_elevenlabs = (settings.elevenlabs_voice_id or "").strip()
+
+        text = (scene.get("text") or "").strip()
+        if not text:
+            raise ValueError(f"Scene {scene_idx + 1} has no text")
+        # Never fall back to narration text for image prompts: it can cause the image model
+        # to "render" on-image captions (gibberish/watermarks). Use a safe generic visual
+        # prompt if the LLM didn't provide a visual_description.
+        vis = (scene.get("visual_description") or "").strip()
+        if not vis:
+            vis = "soft abstract atmospheric background, gentle gradients, cinematic lighting, no text"
+        voice_id = _voice_id_for_scene(series.voice_language, scene, default_elevenlabs)
+        scene_type = (scene.get("scene_type") or "narration").lower()
+        emotion_tag = (scene.get("emotion") or "").strip() if scene_type == "dialogue" else None
+
+        cached_asset_id = get_cached_tts_asset_id(db, workspace_id, text, voice_id)
+        existing = None
+        if cached_asset_id:
+            existing = db.query(Asset).filter(
+                Asset.id == cached_asset_id,
+                Asset.workspace_id == workspace_id,
+                Asset.type == "audio",
+            ).first()
+
+        asset_rows: list[dict] = []
+        # Voice and image are independent network calls; overlap them.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            img_future = pool.submit(
+                _image_scene_worker, settings, workspace_id, episode_id, scene_idx, vis
+            )
+            if existing is not None:
+                voice_asset_id = str(existing.id)
+                duration = existing.duration_seconds if existing.duration_seconds is not None else 5.0
+            else:
+                duration, url_voice = _tts_scene_worker(
+                    settings, workspace_id, episode_id, scene_idx, text, voice_id, emotion_tag
+                )
+                voice_asset_id = str(uuid.uuid4())
+                asset_rows.append({
+                    "id": voice_asset_id,
+                    "workspace_id": str(workspace_id),
+                    "type": "audio",
+                    "source": "generated",
+                    "url": url_voice,
+                    "format": "audio/mpeg",
+                    "duration_seconds": duration,
+                    "metadata_": {
+                        **meta,
+                        "role": "scene_voice",
+                        "scene_index": scene_idx,
+                        **tts_cache_metadata(text, voice_id),
+                    },
+                })
+            image_asset_id = None
+            url_image = img_future.result()
+            if url_image:
+                image_asset_id = str(uuid.uuid4())
+                asset_rows.append({
+                    "id": image_asset_id,
+                    "workspace_id": str(workspace_id),
+                    "type": "image",
+                    "source": "generated",
+                    "url": url_image,
+                    "format": "image/png",
+                    "duration_seconds": None,
+                    "metadata_": {**meta, "role": "scene_cover", "scene_index": scene_idx},
+                })
+
+        return {
+            "scene_index": scene_idx,
+            "scene_ref": {
+                "image_asset_id": image_asset_id,
+                "voice_asset_id": voice_asset_id,
+                "duration_seconds": duration,
+            },
+            "asset_rows": asset_rows,
+        }
+    except Exception as e:
+        if episode:
+            episode.status = "failed"
+            episode.error = {"step": "media_generation", "scene_index": scene_idx, "message": str(e)}
+            db.commit()
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True)
+def finalize_media(self, scene_results: list[dict], episode_id: str):
+    """Chord callback: persist scene assets, caption, and media refs; chain render."""
+    db: Session = SessionLocal()
+    episode = None
+    try:
+        episode = (
+            db.query(Episode)
+            .options(joinedload(Episode.series), joinedload(Episode.script))
+            .filter(Episode.id == uuid.UUID(episode_id))
+            .one_or_none()
+        )
+        if not episode:
+            raise ValueError(f"Episode {episode_id} not found")
+        series = episode.series
+        script = episode.script
+        workspace_id = series.workspace_id
+        meta = {"episode_id": episode_id}
+
+        ordered = sorted(scene_results, key=lambda r: r["scene_index"])
+        asset_rows = [
+            {
+                **row,
+                "id": uuid.UUID(row["id"]),
+                "workspace_id": uuid.UUID(row["workspace_id"]),
+            }
+            for result in ordered
+            for row in result["asset_rows"]
+        ]
+        scene_refs = [r["scene_ref"] for r in ordered]
+
+        # Caption row joins the same multi-row INSERT; its id is client-side.
+        caption_asset_id = uuid.uuid4()
+        asset_rows.append(
+            {
+                "id": caption_asset_id,
+                "workspace_id": workspace_id,
+                "type": "caption_file",
+                "source": "generated",
+                "url": "",
+                "format": "srt",
+                "duration_seconds": None,
+                "metadata_": {**meta, "text": (script.text if script else "")[:2000]},
+            }
+        )
+        db.bulk_insert_mappings(Asset, asset_rows)
+        music_asset_id = _resolve_music_asset(db, series, workspace_id)
+        episode.error = {
+            "media": {
+                "scenes": scene_refs,
+                "caption_asset_id": str(caption_asset_id),
+                "music_asset_id": str(music_asset_id) if music_asset_id else None,
+            }
+        }
+        episode.status = "generating"
+        db.commit()
+        from app.workers.tasks.render import render_video
+        render_video.delay(episode_id)
+        return {
+            "episode_id": episode_id,
+            "status": "ok",
+            "scene_count": len(scene_refs),
+            "caption_asset_id": str(caption_asset_id),
+        }
+    except Exception as e:
+        if episode:
+            episode.status = "failed"
+            episode.error = {"step": "media_finalize", "message": str(e)}
+            db.commit()
+        raise
     finally:
         db.close()
@@ -1,9 +1,11 @@
 """Post to platform APIs: upload video, set post.status and platform_post_id."""
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session
+from sqlalchemy import update
+from sqlalchemy.orm import Session, joinedload
 
 logger = logging.getLogger(__name__)
 
@@ -11,65 +13,104 @@ from app.db.base import SessionLocal
 from app.db.models.post import Post
 from app.db.models.episode import Episode
 from app.db.models.asset import Asset
-from app.db.models.social_account import SocialAccount
 from app.services.platform_publish import publish_to_platform
 from app.workers.celery_app import celery_app
 
 
+def _set_post(db: Session, post_id: uuid.UUID, **values) -> None:
+    """Write only the given Post columns with a targeted UPDATE and commit.
+
+    Avoids dirtying the loaded instance and flushing every mapped column
+    just to flip status/error.
+    """
+    db.execute(update(Post).where(Post.id == post_id).values(**values))
+    db.commit()
+
+
 @celery_app.task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
 def post_to_platform(self, post_id: str):
     """Load post, episode, video asset, and social account; call platform upload API; set post.status and platform_post_id."""
     db: Session = SessionLocal()
     try:
-        post = db.query(Post).filter(Post.id == uuid.UUID(post_id)).first()
+        pid = uuid.UUID(post_id)
+        # Atomically claim the row before loading anything: the status guard
+        # means only one worker can move a post into "posting", so a
+        # duplicate delivery or retry storm can't publish twice, and
+        # claiming first keeps the commit (which expires loaded instances)
+        # ahead of the eager load below.
+        claimed = db.execute(
+            update(Post)
+            .where(Post.id == pid, Post.status.in_(("pending", "failed")))
+            .values(status="posting")
+            .returning(Post.id)
+        ).first()
+        db.commit()
+        if claimed is None:
+            if db.get(Post, pid) is None:
+                raise ValueError(f"Post {post_id} not found")
+            logger.info("post_to_platform skipped: post %s already claimed", post_id)
+            return {"post_id": post_id, "status": "skipped"}
+
+        # One eager-loaded SELECT instead of four serial ones; the video
+        # asset (no relationship on Episode) is a primary-key get after it.
+        post = (
+            db.query(Post)
+            .options(
+                joinedload(Post.episode).joinedload(Episode.script),
+                joinedload(Post.social_account),
+            )
+            .filter(Post.id == pid)
+            .first()
+        )
         if not post:
             raise ValueError(f"Post {post_id} not found")
 
-        post.status = "posting"
-        db.commit()
-
-        episode = db.query(Episode).filter(Episode.id == post.episode_id).first()
+        episode = post.episode
         if not episode:
-            post.status = "failed"
-            post.error = {"message": "Episode not found"}
-            db.commit()
+            _set_post(db, pid, status="failed", error={"message": "Episode not found"})
             return {"post_id": post_id, "status": "failed"}
 
         video_asset_id = episode.video_asset_id
         if not video_asset_id:
-            post.status = "failed"
-            post.error = {"message": "Episode has no video; run render first"}
-            db.commit()
+            _set_post(db, pid, status="failed", error={"message": "Episode has no video; run render first"})
             return {"post_id": post_id, "status": "failed"}
 
-        video_asset = db.query(Asset).filter(Asset.id == video_asset_id).first()
+        video_asset = db.get(Asset, video_asset_id)
         if not video_asset:
-            post.status = "failed"
-            post.error = {"message": "Video asset not found"}
-            db.commit()
+            _set_post(db, pid, status="failed", error={"message": "Video asset not found"})
             return {"post_id": post_id, "status": "failed"}
 
-        social_account = db.query(SocialAccount).filter(SocialAccount.id == post.social_account_id).first()
+        social_account = post.social_account
         if not social_account:
-            post.status = "failed"
-            post.error = {"message": "Social account not found"}
-            db.commit()
+            _set_post(db, pid, status="failed", error={"message": "Social account not found"})
             return {"post_id": post_id, "status": "failed"}
 
         caption = episode.script.text if episode.script else ""
 
-        status, platform_post_id, err = publish_to_platform(
-            db, social_account, video_asset, caption, post_id
-        )
+        try:
+            status, platform_post_id, err = asyncio.run(
+                publish_to_platform(db, social_account, video_asset, caption, post_id)
+            )
+        except Exception as e:
+            # Release the claim before autoretry so the retry (or a manual
+            # re-run) can move the post out of "posting" again.
+            db.rollback()
+            _set_post(db, pid, status="failed", error={"message": str(e)})
+            raise
 
         if status == "posted":
-            post.status = "posted"
-            post.platform_post_id = platform_post_id
-            post.posted_at = datetime.now(timezone.utc)
-            post.error = None
+            final_status = "posted"
+            _set_post(
+                db,
+                pid,
+                status="posted",
+                platform_post_id=platform_post_id,
+                posted_at=datetime.now(timezone.utc),
+                error=None,
+            )
         else:
-            post.status = "failed"
-            post.error = err
+            final_status = "failed"
+            _set_post(db, pid, status="failed", error=err)
             logger.warning(
                 "post_to_platform failed: post_id=%s platform=%s error=%s",
                 post_id,
@@ -77,7 +118,6 @@ def post_to_platform(self, post_id: str):
                 err,
             )
 
-        db.commit()
-        return {"post_id": post_id, "status": post.status, "platform_post_id": platform_post_id}
+        return {"post_id": post_id, "status": final_status, "platform_post_id": platform_post_id}
     finally:
         db.close()
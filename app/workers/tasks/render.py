@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
 import os
 import subprocess
 import tempfile
+import threading
 import uuid
+from functools import lru_cache
+
 import httpx
 from sqlalchemy.orm import Session
 
@@ -11,19 +16,63 @@ from app.config import get_settings
 from app.db.base import SessionLocal
 from app.db.models.asset import Asset
 from app.db.models.episode import Episode
-from app.services.storage_service import get_download_url, upload_file
+from app.services.storage_service import copy_object, delete_object, get_download_url, upload_file
 from app.utils.ffmpeg_filters import FPS_OUT, zoompan_vf as _zoompan_vf
 from app.workers.celery_app import celery_app
+from app.workers.tasks.media import _probe_duration_seconds
+
+
+@lru_cache(maxsize=1)
+def _get_download_client() -> httpx.Client:
+    """Shared keep-alive client for asset downloads.
+
+    httpx.get() opens (and tears down) a TCP+TLS connection per call; a
+    pooled client reuses connections across the ~2N fetches of a render.
+    Created lazily so each prefork worker child builds its own client.
+    """
+    client = httpx.Client(
+        timeout=60,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+    atexit.register(client.close)
+    return client
 
 
 def _download_asset_url(url: str) -> bytes:
     if url.startswith("https://") or url.startswith("http://"):
-        r = httpx.get(url, timeout=60, follow_redirects=True)
+        r = _get_download_client().get(url)
         r.raise_for_status()
         return r.content
     return b""
 
 
+async def _fetch_all_to_disk(items: list[tuple[str, str]]) -> None:
+    """Download (url, target_path) pairs concurrently onto disk.
+
+    Scene rendering is gated on 2N asset fetches; doing them in one gather
+    over a pooled client amortizes the round-trip latency instead of paying
+    it serially per scene. Non-http URLs are skipped (the caller treats a
+    missing file like the empty-bytes sentinel of _download_asset_url).
+    """
+    http_items = [(u, p) for u, p in items if u.startswith("https://") or u.startswith("http://")]
+    if not http_items:
+        return
+    async with httpx.AsyncClient(
+        timeout=60,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=16),
+    ) as client:
+
+        async def fetch(url: str, path: str) -> None:
+            r = await client.get(url)
+            r.raise_for_status()
+            with open(path, "wb") as f:
+                f.write(r.content)
+
+        await asyncio.gather(*(fetch(u, p) for u, p in http_items))
+
+
 def _run_ffmpeg(cmd: list, timeout: int = 600) -> None:
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
@@ -36,32 +85,153 @@ def _run_ffmpeg(cmd: list, timeout: int = 600) -> None:
         raise RuntimeError(f"ffmpeg failed: {result.stderr[:500]}")
 
 
-def _ken_burns_segment(
-    tmpdir: str,
+def _delete_object_quiet(key: str) -> None:
+    """Best-effort scratch-object cleanup; a leaked .part key is harmless."""
+    try:
+        delete_object(key)
+    except Exception:
+        pass
+
+
+def _run_ffmpeg_to_s3(cmd: list[str], key: str, timeout: int = 1800) -> str:
+    """Run ffmpeg writing fragmented MP4 to stdout and stream it into S3.
+
+    The encoded video goes encoder -> pipe -> multipart upload without ever
+    touching disk, halving bytes moved for large episodes. Fragmented MP4
+    (frag_keyframe+empty_moov) is required because a normal moov atom needs
+    a seekable output. ``cmd`` must not include an output argument.
+
+    The stream lands on a scratch key and is only copied to ``key`` after
+    ffmpeg exits 0, so a failed encode (which EOFs stdout and would complete
+    the multipart upload as a truncated object) never finalizes at the
+    canonical location. A watchdog kills ffmpeg at ``timeout`` so a hung
+    encoder that keeps stdout open can't block the upload read forever.
+    """
+    full = [*cmd, "-f", "mp4", "-movflags", "frag_keyframe+empty_moov", "pipe:1"]
+    try:
+        proc = subprocess.Popen(full, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError as e:
+        raise RuntimeError(
+            "ffmpeg not found. Install it on the machine where the Celery worker runs: "
+            "macOS: brew install ffmpeg — Linux: apt install ffmpeg"
+        ) from e
+    # Drain stderr on a thread so ffmpeg can't deadlock on a full pipe
+    # while we're consuming stdout through the upload.
+    stderr_chunks: list[bytes] = []
+    drain = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+    drain.start()
+    # The watchdog covers the streaming phase: killing ffmpeg EOFs stdout,
+    # which unblocks the S3 read, and the timeout flag turns the resulting
+    # failure into the timeout error below.
+    timed_out = threading.Event()
+
+    def _kill_on_timeout() -> None:
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(timeout, _kill_on_timeout)
+    watchdog.daemon = True
+    watchdog.start()
+    tmp_key = f"{key}.part-{uuid.uuid4().hex}"
+    try:
+        try:
+            upload_file(tmp_key, proc.stdout, "video/mp4")
+        except Exception:
+            proc.kill()
+            raise
+        finally:
+            proc.stdout.close()
+        # stdout is closed/EOF'd by now, so the process exits promptly; the
+        # short grace only guards against a zombie that ignores the pipe.
+        try:
+            returncode = proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            returncode = proc.wait(timeout=10)
+        drain.join(timeout=10)
+        if timed_out.is_set():
+            raise RuntimeError("ffmpeg timed out")
+        if returncode != 0:
+            stderr = b"".join(stderr_chunks).decode(errors="replace")
+            raise RuntimeError(f"ffmpeg failed: {stderr[:500]}")
+        url = copy_object(tmp_key, key, "video/mp4")
+    except Exception:
+        _delete_object_quiet(tmp_key)
+        raise
+    finally:
+        watchdog.cancel()
+    _delete_object_quiet(tmp_key)
+    return url
+
+
+@lru_cache(maxsize=1)
+def _detect_h264_encoder() -> str:
+    """Pick the best working H.264 encoder once per worker process.
+
+    Hardware encoders (NVENC on NVIDIA, VideoToolbox on macOS) move the
+    encode off the CPU; both accept system-memory frames, so the existing
+    software filter graphs need no changes. Each candidate is verified with
+    a tiny null encode — being listed in `ffmpeg -encoders` only proves
+    compile-time support, not that a device is present.
+    """
+    for enc in ("h264_nvenc", "h264_videotoolbox"):
+        try:
+            probe = subprocess.run(
+                [
+                    "ffmpeg", "-hide_banner", "-v", "error",
+                    "-f", "lavfi", "-i", "color=c=black:s=64x64:d=0.1",
+                    "-c:v", enc, "-f", "null", "-",
+                ],
+                capture_output=True,
+                timeout=15,
+            )
+        except Exception:
+            continue
+        if probe.returncode == 0:
+            return enc
+    return "libx264"
+
+
+def _codec_args() -> list[str]:
+    """Video codec arguments for the detected encoder, libx264 fallback."""
+    enc = _detect_h264_encoder()
+    if enc == "h264_nvenc":
+        return ["-c:v", "h264_nvenc", "-preset", "p4"]
+    if enc == "h264_videotoolbox":
+        return ["-c:v", "h264_videotoolbox", "-b:v", "4M"]
+    return ["-c:v", "libx264", "-preset", "fast"]
+
+
+def _ken_burns_cmd(
     image_path: str | None,
     voice_path: str,
     duration: float,
-    segment_path: str,
     animation: dict | None = None,
-) -> None:
-    fps_out = FPS_OUT
+) -> list[str]:
+    """Build the Ken Burns encode command without an output argument."""
     vf = _zoompan_vf(duration, animation)
     if image_path and os.path.isfile(image_path):
-        cmd = [
+        return [
             "ffmpeg", "-y", "-loop", "1", "-i", image_path,
             "-i", voice_path, "-shortest", "-vf", vf,
-            "-c:v", "libx264", "-preset", "fast", "-c:a", "aac", "-b:a", "128k",
-            segment_path,
+            *_codec_args(), "-c:a", "aac", "-b:a", "128k",
         ]
-    else:
-        cmd = [
-            "ffmpeg", "-y", "-f", "lavfi",
-            "-i", f"color=c=black:s=1080x1920:d={max(1, duration)}",
-            "-i", voice_path, "-shortest",
-            "-c:v", "libx264", "-preset", "fast", "-c:a", "aac", "-b:a", "128k",
-            segment_path,
-        ]
-    _run_ffmpeg(cmd)
+    return [
+        "ffmpeg", "-y", "-f", "lavfi",
+        "-i", f"color=c=black:s=1080x1920:d={max(1, duration)}",
+        "-i", voice_path, "-shortest",
+        *_codec_args(), "-c:a", "aac", "-b:a", "128k",
+    ]
+
+
+def _ken_burns_segment(
+    image_path: str | None,
+    voice_path: str,
+    duration: float,
+    segment_path: str,
+    animation: dict | None = None,
+) -> None:
+    _run_ffmpeg([*_ken_burns_cmd(image_path, voice_path, duration, animation), segment_path])
 
 
 @celery_app.task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
@@ -69,7 +239,7 @@ def render_video(self, episode_id: str):
     db: Session = SessionLocal()
     episode = None
     try:
-        episode = db.query(Episode).filter(Episode.id == uuid.UUID(episode_id)).first()
+        episode = db.get(Episode, uuid.UUID(episode_id))
         if not episode:
             raise ValueError(f"Episode {episode_id} not found")
 
@@ -83,71 +253,102 @@ def render_video(self, episode_id: str):
             # --- Scene-based: render each segment then concat ---
             workspace_id = None
             with tempfile.TemporaryDirectory() as tmpdir:
-                segment_paths = []
+                # Pass 1: resolve assets and signed URLs, queue all downloads.
+                # Every asset row is fetched in one IN() query so the serial
+                # DB work before the concurrent fetch phase is a single round
+                # trip rather than two SELECTs per scene.
+                asset_ids: list[uuid.UUID] = []
+                for idx, ref in enumerate(scenes):
+                    if not ref.get("voice_asset_id"):
+                        raise ValueError(f"Scene {idx} missing voice_asset_id")
+                    asset_ids.append(uuid.UUID(ref["voice_asset_id"]))
+                    if ref.get("image_asset_id"):
+                        asset_ids.append(uuid.UUID(str(ref["image_asset_id"])))
+                assets_by_id = {
+                    a.id: a for a in db.query(Asset).filter(Asset.id.in_(asset_ids))
+                }
+
+                downloads: list[tuple[str, str]] = []
+                scene_plans: list[tuple[int, str, str | None, float, dict | None]] = []
                 total_duration = 0.0
                 for idx, ref in enumerate(scenes):
                     voice_asset_id = ref.get("voice_asset_id")
-                    if not voice_asset_id:
-                        raise ValueError(f"Scene {idx} missing voice_asset_id")
-                    voice_asset = db.query(Asset).filter(Asset.id == uuid.UUID(voice_asset_id)).first()
+                    voice_asset = assets_by_id.get(uuid.UUID(voice_asset_id))
                     if not voice_asset:
                         raise ValueError(f"Voice asset {voice_asset_id} not found")
                     if workspace_id is None:
                         workspace_id = voice_asset.workspace_id
-                    voice_url = get_download_url(voice_asset.url)
-                    voice_data = _download_asset_url(voice_url)
-                    if not voice_data:
-                        raise ValueError(f"Could not download voice for scene {idx}")
                     voice_path = os.path.join(tmpdir, f"scene_{idx}_voice.mp3")
-                    with open(voice_path, "wb") as f:
-                        f.write(voice_data)
+                    downloads.append((get_download_url(voice_asset.url), voice_path))
                     duration = float(ref.get("duration_seconds") or 5.0)
                     total_duration += duration
 
                     image_path = None
                     image_asset_id = ref.get("image_asset_id")
                     if image_asset_id:
-                        image_asset = db.query(Asset).filter(
-                            Asset.id == uuid.UUID(image_asset_id),
-                            Asset.workspace_id == workspace_id,
-                        ).first()
-                        if image_asset:
-                            image_data = _download_asset_url(get_download_url(image_asset.url))
-                            if image_data:
-                                image_path = os.path.join(tmpdir, f"scene_{idx}.png")
-                                with open(image_path, "wb") as f:
-                                    f.write(image_data)
-
-                    seg_path = os.path.join(tmpdir, f"segment_{idx:04d}.mp4")
-                    scene_animation = ref.get("animation") if isinstance(ref.get("animation"), dict) else None
-                    _ken_burns_segment(
-                        tmpdir, image_path, voice_path, duration, seg_path, animation=scene_animation
-                    )
-                    segment_paths.append(seg_path)
+                        image_asset = assets_by_id.get(uuid.UUID(str(image_asset_id)))
+                        if image_asset and image_asset.workspace_id == workspace_id:
+                            image_path = os.path.join(tmpdir, f"scene_{idx}.png")
+                            downloads.append((get_download_url(image_asset.url), image_path))
 
-                if not segment_paths:
-                    raise ValueError("No segments produced")
+                    scene_animation = ref.get("animation") if isinstance(ref.get("animation"), dict) else None
+                    scene_plans.append((idx, voice_path, image_path, duration, scene_animation))
 
-                # Concat demuxer
-                list_file = os.path.join(tmpdir, "concat.txt")
-                with open(list_file, "w") as f:
-                    for p in segment_paths:
-                        f.write(f"file '{p}'\n")
-                out_mp4 = os.path.join(tmpdir, "out.mp4")
-                concat_cmd = [
-                    "ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_file,
-                    "-c", "copy", out_mp4,
-                ]
-                _run_ffmpeg(concat_cmd)
+                # Pass 2: fetch every voice + image concurrently.
+                asyncio.run(_fetch_all_to_disk(downloads))
 
-                if not os.path.isfile(out_mp4):
-                    raise RuntimeError("ffmpeg concat did not produce output")
+                # Pass 3: one ffmpeg invocation builds the whole reel via
+                # filter_complex — per-scene zoompan chained into a concat
+                # filter. Each frame is encoded exactly once and no
+                # intermediate segment files touch disk.
+                input_args: list[str] = []
+                filters: list[str] = []
+                concat_refs: list[str] = []
+                n_inputs = 0
+                for i, (idx, voice_path, image_path, duration, scene_animation) in enumerate(scene_plans):
+                    if not os.path.isfile(voice_path) or os.path.getsize(voice_path) == 0:
+                        raise ValueError(f"Could not download voice for scene {idx}")
+                    if image_path and (not os.path.isfile(image_path) or os.path.getsize(image_path) == 0):
+                        image_path = None
+                    if image_path:
+                        input_args += ["-loop", "1", "-t", f"{duration:.3f}", "-i", image_path]
+                        filters.append(
+                            f"[{n_inputs}:v]{_zoompan_vf(duration, scene_animation)},"
+                            f"trim=0:{duration:.3f},setpts=PTS-STARTPTS[v{i}]"
+                        )
+                    else:
+                        # Black-frame fallback keeps the graph uniform without
+                        # paying for zoompan on a solid color.
+                        input_args += [
+                            "-f", "lavfi", "-t", f"{max(1.0, duration):.3f}",
+                            "-i", f"color=c=black:s=1080x1920:r={FPS_OUT}",
+                        ]
+                        filters.append(f"[{n_inputs}:v]trim=0:{duration:.3f},setpts=PTS-STARTPTS[v{i}]")
+                    n_inputs += 1
+                    input_args += ["-i", voice_path]
+                    filters.append(f"[{n_inputs}:a]atrim=0:{duration:.3f},asetpts=PTS-STARTPTS[a{i}]")
+                    n_inputs += 1
+                    concat_refs.append(f"[v{i}][a{i}]")
 
+                if not concat_refs:
+                    raise ValueError("No segments produced")
+                filters.append(f"{''.join(concat_refs)}concat=n={len(concat_refs)}:v=1:a=1[v][a]")
+                render_cmd = [
+                    "ffmpeg", "-y", *input_args,
+                    "-filter_complex", ";".join(filters),
+                    "-map", "[v]", "-map", "[a]",
+                    *_codec_args(), "-c:a", "aac", "-b:a", "128k",
+                ]
                 key = f"workspaces/{workspace_id}/episodes/{episode_id}/video.mp4"
-                if settings.aws_access_key_id and settings.aws_secret_access_key:
-                    with open(out_mp4, "rb") as f:
-                        preview_url = upload_file(key, f, "video/mp4")
+                if settings.s3_configured:
+                    # Stream encoder output straight into the multipart
+                    # upload; the final video never lands in tmpdir.
+                    preview_url = _run_ffmpeg_to_s3(render_cmd, key)
                 else:
+                    out_mp4 = os.path.join(tmpdir, "out.mp4")
+                    _run_ffmpeg([*render_cmd, out_mp4], timeout=1800)
+                    if not os.path.isfile(out_mp4):
+                        raise RuntimeError("ffmpeg did not produce output")
                     preview_url = f"https://storage.example.com/{key}"
 
             duration = total_duration
@@ -156,7 +357,7 @@ def render_video(self, episode_id: str):
             voice_asset_id = media.get("voice_asset_id")
             if not voice_asset_id:
                 raise ValueError("Missing voice_asset_id in media")
-            voice_asset = db.query(Asset).filter(Asset.id == uuid.UUID(voice_asset_id)).first()
+            voice_asset = db.get(Asset, uuid.UUID(voice_asset_id))
             if not voice_asset:
                 raise ValueError(f"Voice asset {voice_asset_id} not found")
             workspace_id = voice_asset.workspace_id
@@ -179,21 +380,13 @@ def render_video(self, episode_id: str):
                     raise ValueError("Could not download voice asset")
                 with open(voice_path, "wb") as f:
                     f.write(voice_data)
-                try:
-                    out = subprocess.run(
-                        [
-                            "ffprobe", "-v", "error",
-                            "-show_entries", "format=duration",
-                            "-of", "default=noprint_wrappers=1:nokey=1",
-                            voice_path,
-                        ],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                    )
-                    duration = float(out.stdout.strip()) if out.returncode == 0 and out.stdout else 30.0
-                except (FileNotFoundError, ValueError):
-                    duration = 30.0
+                # Prefer the duration persisted on the asset row; fall back
+                # to an in-process MP3 header parse (mutagen) when it was
+                # never recorded. Either way no ffprobe fork is needed.
+                if voice_asset.duration_seconds:
+                    duration = float(voice_asset.duration_seconds)
+                else:
+                    duration = _probe_duration_seconds(voice_data, default=30.0)
 
                 image_path = None
                 if image_asset:
@@ -202,15 +395,20 @@ def render_video(self, episode_id: str):
                         image_path = os.path.join(tmpdir, "cover.png")
                         with open(image_path, "wb") as f:
                             f.write(image_data)
-                out_mp4 = os.path.join(tmpdir, "out.mp4")
-                _ken_burns_segment(tmpdir, image_path, voice_path, duration, out_mp4)
-                if not os.path.isfile(out_mp4):
-                    raise RuntimeError("ffmpeg did not produce output file")
                 key = f"workspaces/{workspace_id}/episodes/{episode_id}/video.mp4"
-                if settings.aws_access_key_id and settings.aws_secret_access_key:
-                    with open(out_mp4, "rb") as f:
-                        preview_url = upload_file(key, f, "video/mp4")
+                if settings.s3_configured:
+                    # Stream straight from the encoder into the multipart
+                    # upload like the scene path: the video never hits disk,
+                    # so big episodes don't double-buffer through the page
+                    # cache before upload.
+                    preview_url = _run_ffmpeg_to_s3(
+                        _ken_burns_cmd(image_path, voice_path, duration), key
+                    )
                 else:
+                    out_mp4 = os.path.join(tmpdir, "out.mp4")
+                    _ken_burns_segment(image_path, voice_path, duration, out_mp4)
+                    if not os.path.isfile(out_mp4):
+                        raise RuntimeError("ffmpeg did not produce output file")
                     preview_url = f"https://storage.example.com/{key}"
 
         video_asset = Asset(
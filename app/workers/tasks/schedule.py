@@ -5,6 +5,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from app.db.base import SessionLocal
@@ -27,7 +28,7 @@ def schedule_upcoming_episodes(series_id: str):
     """
     db: Session = SessionLocal()
     try:
-        series = db.query(Series).filter(Series.id == uuid.UUID(series_id)).first()
+        series = db.get(Series, uuid.UUID(series_id))
         if not series:
             return {"series_id": series_id, "scheduled": 0, "error": "Series not found"}
 
@@ -38,38 +39,66 @@ def schedule_upcoming_episodes(series_id: str):
         # Next 14 slots (shared logic with launch_series)
         slots = get_next_publish_slots(schedule, count=14)
 
+        # Columns-only scan bounded to the slot window: dedup only needs the
+        # dates the new slots could collide with, so the query stays O(count)
+        # on the (seriesId, scheduledAt) index instead of growing with the
+        # series' full episode history. The ±1 day padding absorbs
+        # timezone-of-day differences on the boundary dates. max() of the
+        # sequence number also survives deleted episodes, unlike count().
         existing_dates = set()
-        for e in db.query(Episode).filter(Episode.series_id == series.id).all():
-            if e.scheduled_at:
-                d = e.scheduled_at.date() if hasattr(e.scheduled_at, "date") else e.scheduled_at
-                existing_dates.add(d)
-        max_seq = db.query(Episode).filter(Episode.series_id == series.id).count()
-        created = 0
-
+        if slots:
+            window = (
+                db.query(Episode.scheduled_at)
+                .filter(
+                    Episode.series_id == series.id,
+                    Episode.scheduled_at >= min(slots) - timedelta(days=1),
+                    Episode.scheduled_at <= max(slots) + timedelta(days=1),
+                )
+            )
+            for (ts,) in window:
+                if ts:
+                    existing_dates.add(ts.date() if hasattr(ts, "date") else ts)
+        max_seq = (
+            db.query(func.coalesce(func.max(Episode.sequence_number), 0))
+            .filter(Episode.series_id == series.id)
+            .scalar()
+        )
+        now = datetime.now(timezone.utc)
+        new_rows: list[dict] = []
+        pending: list[tuple[str, datetime | None]] = []
         for slot_utc in slots:
             slot_date = slot_utc.date() if hasattr(slot_utc, "date") else slot_utc
             if slot_date in existing_dates:
                 continue
             existing_dates.add(slot_date)
             max_seq += 1
-            ep = Episode(
-                id=uuid.uuid4(),
-                series_id=series.id,
-                sequence_number=max_seq,
-                scheduled_at=slot_utc,
-                status="scheduled",
+            episode_id = uuid.uuid4()
+            new_rows.append(
+                {
+                    "id": episode_id,
+                    "series_id": series.id,
+                    "sequence_number": max_seq,
+                    "scheduled_at": slot_utc,
+                    "status": "scheduled",
+                }
             )
-            db.add(ep)
-            db.flush()
-            created += 1
             eta = slot_utc - timedelta(hours=6)
-            if eta > datetime.now(timezone.utc):
-                generate_script.apply_async(args=[str(ep.id)], eta=eta)
-            else:
-                generate_script.delay(str(ep.id))
+            pending.append((str(episode_id), eta if eta > now else None))
 
+        # One multi-row INSERT instead of an add+flush round-trip per slot,
+        # committed before any task can run against the new rows.
+        if new_rows:
+            db.bulk_insert_mappings(Episode, new_rows)
         db.commit()
-        return {"series_id": series_id, "scheduled": created}
+
+        # Reuse a single broker connection for all enqueues instead of
+        # paying connection setup per apply_async.
+        if pending:
+            with celery_app.producer_pool.acquire(block=True) as producer:
+                for episode_id_str, eta in pending:
+                    generate_script.apply_async(args=[episode_id_str], eta=eta, producer=producer)
+
+        return {"series_id": series_id, "scheduled": len(new_rows)}
     finally:
         db.close()
 
@@ -93,6 +122,7 @@ def backfill_orphaned_episodes():
             .filter(
                 Episode.status == "scheduled",
                 Episode.script_id.is_(None),
+                Episode.llm_batch_id.is_(None),  # pending Batch API jobs aren't orphans
                 Series.status == "active",
             )
             .limit(10)
@@ -136,6 +166,7 @@ def publish_due_episodes():
     db: Session = SessionLocal()
     now = datetime.now(timezone.utc)
     published = 0
+    pending_post_ids: list[str] = []
     try:
         episodes = (
             db.query(Episode)
@@ -185,15 +216,21 @@ def publish_due_episodes():
                 continue
             for social_account_id in account_ids:
                 post = Post(
+                    id=uuid.uuid4(),
                     episode_id=ep.id,
                     social_account_id=uuid.UUID(social_account_id),
                     status="pending",
                 )
                 db.add(post)
-                db.flush()
-                post_to_platform.delay(str(post.id))
+                pending_post_ids.append(str(post.id))
                 published += 1
         db.commit()
+        # Enqueue over one broker connection, and only after the rows are
+        # committed so a fast worker can't race an uncommitted Post.
+        if pending_post_ids:
+            with celery_app.producer_pool.acquire(block=True) as producer:
+                for pid in pending_post_ids:
+                    post_to_platform.apply_async(args=[pid], producer=producer)
         return {"published": published}
     finally:
         db.close()
@@ -7,12 +7,34 @@ from app.services.generation_service import run_script_generation
 from app.workers.celery_app import celery_app
 
 
+@celery_app.task
+def poll_script_batches():
+    """Collect finished OpenAI Batch API script jobs. Runs via Celery Beat."""
+    from app.services.llm_batch import collect_batch_results
+
+    db = SessionLocal()
+    collected = 0
+    try:
+        batch_ids = [
+            row[0]
+            for row in db.query(Episode.llm_batch_id)
+            .filter(Episode.llm_batch_id.isnot(None))
+            .distinct()
+            .all()
+        ]
+        for batch_id in batch_ids:
+            collected += collect_batch_results(db, batch_id)
+        return {"batches": len(batch_ids), "episodes_completed": collected}
+    finally:
+        db.close()
+
+
 @celery_app.task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
 def generate_script(self, episode_id: str):
     db = SessionLocal()
     episode = None
     try:
-        episode = db.query(Episode).filter(Episode.id == uuid.UUID(episode_id)).first()
+        episode = db.get(Episode, uuid.UUID(episode_id))
         if not episode:
             raise ValueError(f"Episode {episode_id} not found")
 
@@ -0,0 +1,122 @@
+"""
+Tests for publish-slot generation (cheap: pure date math, no API, no DB).
+
+"Now" is frozen to 2026-03-10 12:00 UTC (a Tuesday) so the first-offset
+and day-boundary behavior is deterministic.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services import schedule_slots
+from app.services.schedule_slots import get_next_publish_slots
+
+FROZEN_NOW = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        if tz is not None:
+            return FROZEN_NOW.astimezone(tz)
+        return FROZEN_NOW.replace(tzinfo=None)
+
+
+@pytest.fixture(autouse=True)
+def _freeze_now(monkeypatch):
+    monkeypatch.setattr(schedule_slots, "datetime", _FrozenDatetime)
+
+
+def test_daily_future_start_emits_consecutive_days():
+    slots = get_next_publish_slots(
+        {"frequency": "daily", "publishTime": "09:00", "startDate": "2026-04-01T00:00:00Z"},
+        count=5,
+    )
+    assert slots == [
+        datetime(2026, 4, 1 + i, 9, 0, tzinfo=timezone.utc) for i in range(5)
+    ]
+
+
+def test_daily_past_start_anchors_to_now():
+    # Start date long past and today's 09:00 already gone -> first slot tomorrow.
+    slots = get_next_publish_slots(
+        {"frequency": "daily", "publishTime": "09:00", "startDate": "2026-01-01T00:00:00Z"},
+        count=3,
+    )
+    assert slots[0] == datetime(2026, 3, 11, 9, 0, tzinfo=timezone.utc)
+    assert [b - a for a, b in zip(slots, slots[1:])] == [timedelta(days=1)] * 2
+
+
+def test_first_offset_day_boundary_correction():
+    # Publish time still ahead of the frozen 12:00 -> today's slot counts.
+    later = get_next_publish_slots({"publishTime": "13:00"}, count=1)
+    assert later[0] == datetime(2026, 3, 10, 13, 0, tzinfo=timezone.utc)
+    # Publish time already past -> the +1 correction pushes to tomorrow.
+    earlier = get_next_publish_slots({"publishTime": "11:00"}, count=1)
+    assert earlier[0] == datetime(2026, 3, 11, 11, 0, tzinfo=timezone.utc)
+
+
+def test_weekly_without_custom_days_emits_daily():
+    slots = get_next_publish_slots(
+        {"frequency": "weekly", "publishTime": "13:00"}, count=4
+    )
+    assert len(slots) == 4
+    assert [b - a for a, b in zip(slots, slots[1:])] == [timedelta(days=1)] * 3
+
+
+def test_weekly_custom_days_only_selected_weekdays():
+    # Monday (0) and Wednesday (2); frozen now is Tuesday 12:00.
+    slots = get_next_publish_slots(
+        {"frequency": "weekly", "publishTime": "09:00", "customDays": [0, 2]},
+        count=4,
+    )
+    assert len(slots) == 4
+    assert all(s.weekday() in (0, 2) for s in slots)
+    assert slots == sorted(slots)
+    assert slots[0] == datetime(2026, 3, 11, 9, 0, tzinfo=timezone.utc)  # Wednesday
+    assert slots[1] == datetime(2026, 3, 16, 9, 0, tzinfo=timezone.utc)  # next Monday
+
+
+def test_weekly_custom_days_ignores_non_int_entries():
+    slots = get_next_publish_slots(
+        {"frequency": "weekly", "publishTime": "09:00", "customDays": ["monday", 4]},
+        count=3,
+    )
+    assert len(slots) == 3
+    assert all(s.weekday() == 4 for s in slots)
+
+
+def test_weekly_empty_custom_days_behaves_like_daily():
+    slots = get_next_publish_slots(
+        {"frequency": "weekly", "publishTime": "13:00", "customDays": []}, count=5
+    )
+    assert len(slots) == 5
+    assert [b - a for a, b in zip(slots, slots[1:])] == [timedelta(days=1)] * 4
+
+
+def test_publish_time_interpreted_in_schedule_timezone():
+    # 09:00 America/New_York in April is EDT (UTC-4) -> 13:00 UTC. The start
+    # is noon UTC so the local calendar date is April 1 on both sides.
+    slots = get_next_publish_slots(
+        {
+            "publishTime": "09:00",
+            "timezone": "America/New_York",
+            "startDate": "2026-04-01T12:00:00Z",
+        },
+        count=1,
+    )
+    assert slots[0] == datetime(2026, 4, 1, 13, 0, tzinfo=timezone.utc)
+
+
+def test_invalid_timezone_falls_back_to_utc():
+    slots = get_next_publish_slots(
+        {"publishTime": "13:00", "timezone": "Not/AZone"}, count=1
+    )
+    assert slots[0] == datetime(2026, 3, 10, 13, 0, tzinfo=timezone.utc)
+
+
+def test_none_schedule_uses_defaults():
+    slots = get_next_publish_slots(None)
+    assert len(slots) == 7
+    assert all(s.tzinfo is not None and s > FROZEN_NOW for s in slots)